@@ -3,6 +3,7 @@
 
 import os
 import sys
+import shutil
 import logging
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, simpledialog
@@ -12,6 +13,10 @@ import traceback
 import re
 import threading
 import queue
+import inspect
+import time
+import bisect
+import weakref
 
 # 检查是否安装了customtkinter
 try:
@@ -36,8 +41,8 @@ class LogManager:
         """
         self.logger = logging.getLogger('novel_app')
         self.logger.setLevel(log_level)
-        self.log_queue = queue.Queue()
-        self.log_windows = []
+        # 弱引用集合：窗口对象被回收后自动消失，不会因漏注销而泄漏
+        self.log_windows = weakref.WeakSet()
         
         # 确保日志目录存在
         self.log_dir = Path("logs")
@@ -49,42 +54,39 @@ class LogManager:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         
-        # 如果没有处理器，添加控制台处理器
+        # 如果没有处理器，添加统一的多路分发处理器
         if not self.logger.handlers:
-            # 控制台处理器
-            console_handler = logging.StreamHandler()
-            console_handler.setFormatter(self.formatter)
-            self.logger.addHandler(console_handler)
-            
-            # 队列处理器(用于GUI显示)
-            queue_handler = QueueHandler(self.log_queue)
-            queue_handler.setFormatter(self.formatter)
-            self.logger.addHandler(queue_handler)
-            
-            # 创建默认的日志文件
-            self._setup_default_file_handler()
-    
-    def _setup_default_file_handler(self):
-        """设置默认的文件处理器"""
-        default_log_file = self.log_dir / f"novel_app_{datetime.now().strftime('%Y%m%d')}.log"
-        file_handler = logging.FileHandler(default_log_file, encoding='utf-8')
-        file_handler.setFormatter(self.formatter)
-        self.logger.addHandler(file_handler)
-        self.info(f"日志文件已创建: {default_log_file}")
+            default_log_file = self.log_dir / f"novel_app_{datetime.now().strftime('%Y%m%d')}.log"
+            sink_handler = MultiSinkHandler(self, default_log_file)
+            sink_handler.setFormatter(self.formatter)
+            self.logger.addHandler(sink_handler)
+            self.file_handler = sink_handler.file_sink
+            self.info(f"日志文件已创建: {default_log_file}")
     
     def get_logger(self):
         """获取logger实例"""
         return self.logger
+
+    @property
+    def has_log_windows(self):
+        """是否有已注册的日志窗口"""
+        return bool(self.log_windows)
     
     def register_window(self, window):
         """注册日志窗口"""
-        if window not in self.log_windows:
-            self.log_windows.append(window)
-    
+        self.log_windows.add(window)
+
+    def dispatch_to_windows(self, record, msg):
+        """把一条已格式化的日志分发到每个窗口各自的队列"""
+        for window in list(self.log_windows):
+            try:
+                window.log_queue.put((record, msg))
+            except Exception:
+                pass
+
     def unregister_window(self, window):
         """注销日志窗口"""
-        if window in self.log_windows:
-            self.log_windows.remove(window)
+        self.log_windows.discard(window)
     
     def debug(self, message):
         """记录DEBUG级别日志"""
@@ -132,13 +134,26 @@ class LogManager:
             # 构建完整文件路径
             file_path = self.log_dir / filename
         
-        # 从日志窗口获取日志文本
+        # 优先直接复制当前日志文件，避免从GUI文本框拉取整段文本
+        try:
+            for handler in self.logger.handlers:
+                source_file = getattr(handler, 'baseFilename', None)
+                if source_file and os.path.exists(source_file):
+                    handler.flush()
+                    file_path.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copyfile(source_file, file_path)
+                    self.info(f"日志已保存到: {file_path}")
+                    return file_path
+        except Exception as e:
+            self.error(f"复制日志文件时出错: {e}")
+
+        # 回退方案：从日志窗口获取日志文本
         log_text = ""
         for window in self.log_windows:
             if hasattr(window, 'get_log_text'):
                 log_text = window.get_log_text()
                 break
-        
+
         # 如果没有日志窗口或无法获取日志文本，记录错误
         if not log_text:
             self.error("无法获取日志文本以保存到文件")
@@ -157,21 +172,154 @@ class LogManager:
             return None
 
 
-class QueueHandler(logging.Handler):
+class MultiSinkHandler(logging.Handler):
     """
-    将日志记录放入队列的处理器
+    单次格式化、多路分发的日志处理器
+
+    每条记录只format()一次，把同一结果分发到控制台、日志文件
+    (后台批量写入)和GUI日志队列，取代控制台/队列/文件三个
+    独立处理器各自重复格式化的做法。
     """
-    def __init__(self, log_queue):
+
+    def __init__(self, manager, filename):
         super().__init__()
-        self.log_queue = log_queue
-    
+        self.manager = manager
+        self.console_stream = sys.stderr
+        self.file_sink = AsyncBatchingFileHandler(filename)
+        self.baseFilename = self.file_sink.baseFilename
+
     def emit(self, record):
         try:
             msg = self.format(record)
-            self.log_queue.put((record, msg))
+            line = msg + '\n'
+
+            # 控制台
+            try:
+                self.console_stream.write(line)
+            except Exception:
+                pass
+
+            # 日志文件(交给后台写入线程)
+            self.file_sink.submit(line.encode('utf-8'))
+
+            # GUI日志队列(没有日志窗口时跳过，避免无谓入队)
+            # 每个窗口有独立队列，同一条记录分发给所有窗口
+            if self.manager.has_log_windows:
+                self.manager.dispatch_to_windows(record, msg)
         except Exception:
             self.handleError(record)
 
+    def flush(self):
+        try:
+            self.console_stream.flush()
+        except Exception:
+            pass
+        self.file_sink.flush()
+
+    def close(self):
+        self.file_sink.close()
+        super().close()
+
+
+class AsyncBatchingFileHandler(logging.Handler):
+    """
+    异步批量写入的文件日志处理器
+
+    emit()只负责格式化和入队，磁盘写入由后台线程完成：
+    缓冲达到64KiB或距上次写入超过200ms时一次性os.write落盘，
+    约每秒fsync一次；flush()和close()时强制刷盘。
+    """
+
+    _FLUSH = object()
+    _STOP = object()
+
+    def __init__(self, filename, encoding='utf-8'):
+        super().__init__()
+        self.baseFilename = os.fspath(filename)
+        self.encoding = encoding
+        self._file = open(self.baseFilename, 'ab')
+        self._queue = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._writer_loop)
+        self._writer.daemon = True
+        self._writer.start()
+
+    def emit(self, record):
+        try:
+            msg = self.format(record)
+            self.submit((msg + '\n').encode(self.encoding))
+        except Exception:
+            self.handleError(record)
+
+    def submit(self, data):
+        """把已编码的日志行交给后台写入线程"""
+        self._queue.put(data)
+
+    def flush(self):
+        """强制把缓冲写入磁盘并fsync"""
+        try:
+            done = threading.Event()
+            self._queue.put((self._FLUSH, done))
+            done.wait(timeout=2.0)
+        except Exception:
+            pass
+
+    def close(self):
+        try:
+            self._queue.put(self._STOP)
+            self._writer.join(timeout=2.0)
+            self._file.close()
+        except Exception:
+            pass
+        super().close()
+
+    def _writer_loop(self):
+        """后台写入线程：批量聚合日志行后写入磁盘"""
+        buffer = bytearray()
+        fd = self._file.fileno()
+        last_write = time.monotonic()
+        last_sync = last_write
+        dirty = False
+        running = True
+
+        while running:
+            try:
+                item = self._queue.get(timeout=0.2)
+            except queue.Empty:
+                item = None
+
+            flush_event = None
+            if item is self._STOP:
+                running = False
+            elif isinstance(item, tuple) and item[0] is self._FLUSH:
+                flush_event = item[1]
+            elif item is not None:
+                buffer += item
+
+            now = time.monotonic()
+
+            # 缓冲过大、超时、flush或退出时批量写入
+            if buffer and (len(buffer) >= 64 * 1024 or now - last_write >= 0.2
+                           or flush_event is not None or not running):
+                try:
+                    os.write(fd, buffer)
+                    dirty = True
+                except OSError as e:
+                    print(f"写入日志文件出错: {e}")
+                buffer.clear()
+                last_write = now
+
+            # 约每秒fsync一次；flush和退出时强制fsync
+            if dirty and (now - last_sync >= 1.0 or flush_event is not None or not running):
+                try:
+                    os.fsync(fd)
+                except OSError:
+                    pass
+                dirty = False
+                last_sync = now
+
+            if flush_event is not None:
+                flush_event.set()
+
 
 class LogWindow:
     """
@@ -186,12 +334,20 @@ class LogWindow:
             log_manager: 日志管理器实例
         """
         self.parent = parent
-        
+
+        # Python侧日志文本镜像：按行起始偏移建表，搜索时无需遍历Tk文本
+        self._log_chunks = []
+        self._log_len = 0
+        self._line_starts = [0]
+
         # 如果没有提供日志管理器，使用全局实例
         if log_manager is None:
             self.log_manager = get_log_manager()
         else:
             self.log_manager = log_manager
+
+        # 本窗口专属的日志队列：关闭哨兵只会落到自己的消费线程
+        self.log_queue = queue.Queue()
         
         # 创建窗口
         self._create_window()
@@ -200,7 +356,7 @@ class LogWindow:
         self.log_manager.register_window(self)
         
         # 启动日志更新线程
-        self.running = True
+        self._stop_event = threading.Event()
         self.update_thread = threading.Thread(target=self._update_log_from_queue)
         self.update_thread.daemon = True
         self.update_thread.start()
@@ -478,24 +634,26 @@ class LogWindow:
     
     def _update_log_from_queue(self):
         """从队列中更新日志显示"""
-        while self.running:
+        while not self._stop_event.is_set():
             try:
-                # 等待队列中的新日志记录，每100ms超时一次(允许线程退出检查)
-                try:
-                    record, message = self.log_manager.log_queue.get(block=True, timeout=0.1)
-                except queue.Empty:
-                    continue
-                
+                # 阻塞等待本窗口队列中的新日志记录，空闲时线程完全休眠
+                record, message = self.log_queue.get(block=True)
+
+                # 收到哨兵值表示窗口关闭，退出线程
+                if record is None:
+                    self.log_queue.task_done()
+                    break
+
                 # 检查日志级别是否符合当前过滤条件
                 if self._should_display_log(record):
                     self._append_log(record, message)
-                
+
                 # 标记处理完成
-                self.log_manager.log_queue.task_done()
+                self.log_queue.task_done()
             except Exception as e:
                 # 避免线程崩溃
                 print(f"日志更新线程出错: {e}")
-        
+
         print("日志更新线程已退出")
     
     def _should_display_log(self, record):
@@ -522,13 +680,22 @@ class LogWindow:
         
         try:
             # 添加日志
+            text = message + "\n"
             self.log_text.configure(state="normal")
-            self.log_text.insert("end", message + "\n", tag)
-            
+            self.log_text.insert("end", text, tag)
+
+            # 同步维护Python侧镜像和行起始偏移表
+            self._log_chunks.append(text)
+            pos = text.find('\n')
+            while pos != -1:
+                self._line_starts.append(self._log_len + pos + 1)
+                pos = text.find('\n', pos + 1)
+            self._log_len += len(text)
+
             # 如果自动滚动开启，则滚动到最新的日志
             if self.auto_scroll_var.get():
                 self.log_text.see("end")
-            
+
             self.log_text.configure(state="disabled")
         except tk.TclError:
             # 窗口可能已被销毁
@@ -541,34 +708,48 @@ class LogWindow:
             self.log_text.configure(state="normal")
             self.log_text.delete("1.0", "end")
             self.log_text.configure(state="disabled")
-            
+            self._reset_log_mirror()
+
             # 记录级别变更
             self.log_manager.info(f"日志显示级别已更改为: {level}")
         except tk.TclError:
             # 窗口可能已被销毁
             pass
     
+    def _reset_log_mirror(self):
+        """清空Python侧的日志镜像和行偏移表"""
+        self._log_chunks = []
+        self._log_len = 0
+        self._line_starts = [0]
+
+    def _offset_to_index(self, offset):
+        """把字符偏移转换为Tk文本索引(line.col)"""
+        line = bisect.bisect_right(self._line_starts, offset) - 1
+        return f"{line + 1}.{offset - self._line_starts[line]}"
+
     def _on_search(self):
         """搜索处理"""
         search_text = self.search_var.get().strip()
         if not search_text:
             return
-        
+
         try:
             # 移除现有高亮
             self.log_text.tag_remove("HIGHLIGHT", "1.0", "end")
-            
-            # 搜索并高亮匹配文本
-            start_pos = "1.0"
-            while True:
-                start_pos = self.log_text.search(search_text, start_pos, "end", nocase=True)
-                if not start_pos:
-                    break
-                
-                end_pos = f"{start_pos}+{len(search_text)}c"
-                self.log_text.tag_add("HIGHLIGHT", start_pos, end_pos)
-                start_pos = end_pos
-            
+
+            # 在Python侧镜像中查找匹配，再按行偏移表换算成Tk索引
+            if len(self._log_chunks) > 1:
+                self._log_chunks = [''.join(self._log_chunks)]
+            haystack = self._log_chunks[0].lower() if self._log_chunks else ""
+            needle = search_text.lower()
+            length = len(search_text)
+
+            pos = haystack.find(needle)
+            while pos != -1:
+                start_pos = self._offset_to_index(pos)
+                self.log_text.tag_add("HIGHLIGHT", start_pos, f"{start_pos}+{length}c")
+                pos = haystack.find(needle, pos + length)
+
             # 记录搜索动作
             self.log_manager.info(f"日志搜索: {search_text}")
         except tk.TclError:
@@ -593,7 +774,8 @@ class LogWindow:
             self.log_text.configure(state="normal")
             self.log_text.delete("1.0", "end")
             self.log_text.configure(state="disabled")
-            
+            self._reset_log_mirror()
+
             # 记录清空动作
             self.log_manager.info("日志已清空")
         except tk.TclError:
@@ -645,9 +827,10 @@ class LogWindow:
     
     def _on_close(self):
         """关闭窗口"""
-        # 停止更新线程
-        self.running = False
-        
+        # 停止更新线程：置位停止事件并向本窗口队列放入哨兵值唤醒阻塞中的get
+        self._stop_event.set()
+        self.log_queue.put((None, None))
+
         try:
             # 注销窗口
             self.log_manager.unregister_window(self)
@@ -714,18 +897,25 @@ def log_operation(level=logging.INFO, show_args=False):
         装饰器函数
     """
     def decorator(func):
+        # 获取函数名称和模块(装饰时确定一次，避免每次调用重复计算)
+        func_name = func.__name__
+        module_name = func.__module__
+
+        # 装饰时判断首个参数是否为self/cls，调用时无需再做属性探测
+        try:
+            params = list(inspect.signature(func).parameters)
+            is_method = bool(params) and params[0] in ('self', 'cls')
+        except (TypeError, ValueError):
+            is_method = False
+
         def wrapper(*args, **kwargs):
             log_manager = get_log_manager()
             logger = log_manager.get_logger()
-            
-            # 获取函数名称和模块
-            func_name = func.__name__
-            module_name = func.__module__
-            
+
             # 构建日志消息
             if show_args:
                 # 过滤掉self参数
-                filtered_args = args[1:] if args and hasattr(args[0], func_name) else args
+                filtered_args = args[1:] if is_method and args else args
                 args_str = ', '.join([str(arg) for arg in filtered_args])
                 kwargs_str = ', '.join([f"{k}={v}" for k, v in kwargs.items()])
                 params = []
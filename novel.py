@@ -12,22 +12,37 @@ import shutil  # For moving directories and emptying trash
 import uuid  # Potentially for more robust unique naming
 import glob
 import tkinter.font as tkFont
-import configparser  # 用于保存配置
 import platform  # 获取操作系统信息
 import subprocess  # For opening folders on macOS and Linux
 import string  # 添加string模块导入，用于字数统计的正则表达式
+import functools  # lru_cache缓存纯函数结果
+import stat  # 解析os.stat结果的文件类型
+from collections import OrderedDict, deque  # LRU缓存用的有序字典；控件树遍历用的双端队列
+from concurrent.futures import ThreadPoolExecutor  # 搜索时并行读取文件
+import threading  # 保护并行搜索下的共享缓存
+import errno  # 识别跨设备移动错误
+import secrets  # 回收站唯一命名用的随机token
+import bisect  # 向有序分类列表插入新项
+import contextlib  # 批量操作上下文管理器
 import sys  # 添加sys模块导入，用于字数统计的正则表达式
 import time  # 添加time模块导入，用于字数统计的正则表达式
 
-# Import the theme library - place this early
-try:
-    import sv_ttk
+# sv-ttk主题库按需导入：只有在真正应用该主题时才加载，缩短冷启动时间
+sv_ttk = None
+HAS_SVTTK = None  # None表示尚未尝试导入
 
-    HAS_SVTTK = True
-except ImportError:
-    # print("Warning: sv-ttk theme library not found. Using default Tkinter theme.")
-    sv_ttk = None
-    HAS_SVTTK = False
+
+def _svttk_available():
+    """按需导入sv_ttk；返回该主题库是否可用"""
+    global sv_ttk, HAS_SVTTK
+    if HAS_SVTTK is None:
+        try:
+            import sv_ttk
+            HAS_SVTTK = True
+        except ImportError:
+            # print("Warning: sv-ttk theme library not found. Using default Tkinter theme.")
+            HAS_SVTTK = False
+    return HAS_SVTTK
 
 # 尝试导入CustomTkinter
 try:
@@ -40,22 +55,172 @@ except ImportError:
     HAS_CTK = False
     HAS_CTK_PANED = False
 
-# 导入AI相关功能
-try:
-    from ai import AIEngine, ConfigDialog, OptimizeDialog, load_ai_config, get_ai_engine
+# AI相关功能按需导入：ai模块依赖requests等较重的第三方库，
+# 推迟到第一次使用AI功能时再加载
+HAS_AI = None  # None表示尚未尝试导入
+AIEngine = ConfigDialog = OptimizeDialog = load_ai_config = get_ai_engine = None
+
+
+def _ai_available():
+    """按需导入AI模块；返回AI功能是否可用"""
+    global HAS_AI, AIEngine, ConfigDialog, OptimizeDialog, load_ai_config, get_ai_engine
+    if HAS_AI is None:
+        try:
+            from ai import AIEngine, ConfigDialog, OptimizeDialog, load_ai_config, get_ai_engine
+            HAS_AI = True
+        except ImportError:
+            print("Warning: AI功能模块未找到。部分功能将不可用。")
+            HAS_AI = False
+    return HAS_AI
+
+
+# 文件名/分类名校验用的预编译正则，避免在热路径上反复编译
+_INVALID_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+# 非法字符和控制字符融合成单个字符类，一次扫描完成校验
+_INVALID_NAME_RE = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_RESERVED_DEVICE_RE = re.compile(r"^(?:CON|PRN|AUX|NUL|(?:COM|LPT)\d)$")
+
+# 条目文件解析/回收站命名用的预编译正则
+_FRONT_MATTER_RE = re.compile(r"^---\s*?\n(.*?)\n^---\s*?\n?(.*)", re.MULTILINE | re.DOTALL)
+_TRASH_TS_RE = re.compile(r"^\d{8}_\d{6}(?:_\d+)?_(?:[0-9a-f]{6}_)?(.*)")
+_TAG_SPLIT_RE = re.compile(r"\s*,\s*")
+_DIR_SUFFIX_RE = re.compile(r'_(?:\d+|[0-9a-f]{6})$')
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_path(path_str):
+    """同一路径串只构造一次Path对象；界面处理器反复引用同一批路径时省去重复解析"""
+    return Path(path_str)
 
-    HAS_AI = True
+# 可选的orjson库：条目元数据的解析/序列化用它明显更快，未安装时退回标准库json
+try:
+    import orjson
 except ImportError:
-    print("Warning: AI功能模块未找到。部分功能将不可用。")
-    HAS_AI = False
+    orjson = None
+
+
+def _json_loads(s):
+    """解析JSON字符串，优先使用orjson"""
+    if orjson is not None:
+        return orjson.loads(s)
+    return json.loads(s)
+
+
+def _json_dumps(obj):
+    """序列化为紧凑JSON字符串（非ASCII原样保留），优先使用orjson"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+
+# settings.ini解析结果缓存：键为(路径, mtime_ns)，文件未变化时直接复用
+_config_cache = {}
+
+# 轻量INI语法：settings.ini只有简单的节和键值对，无需完整的configparser
+_INI_SECTION_RE = re.compile(r'^\s*\[([^\]]+)\]\s*$')
+_INI_OPTION_RE = re.compile(r'^\s*([^=:\s][^=:]*?)\s*[=:]\s*(.*?)\s*$')
+
+
+def _parse_ini(text):
+    """轻量INI解析：返回 {节名: {键: 值}}，键统一小写"""
+    sections = {}
+    current = None
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith(('#', ';')):
+            continue
+        section_match = _INI_SECTION_RE.match(line)
+        if section_match:
+            current = sections.setdefault(section_match.group(1).strip(), {})
+            continue
+        if current is None:
+            continue
+        option_match = _INI_OPTION_RE.match(line)
+        if option_match:
+            current[option_match.group(1).lower()] = option_match.group(2)
+    return sections
+
+
+def _read_settings_config(config_path):
+    """读取配置文件，按文件mtime缓存解析结果，文件不存在时返回None"""
+    try:
+        stat_result = os.stat(config_path)
+    except OSError:
+        return None
+
+    cache_key = (str(config_path), stat_result.st_mtime_ns)
+    config = _config_cache.get(cache_key)
+    if config is None:
+        try:
+            text = Path(config_path).read_text(encoding='utf-8')
+        except OSError:
+            return None
+        config = _parse_ini(text)
+        # 只保留当前版本的解析结果
+        _config_cache.clear()
+        _config_cache[cache_key] = config
+    return config
+
+
+# Windows字体注册相关API常量
+_HWND_BROADCAST = 0xFFFF
+_WM_FONTCHANGE = 0x001D
+_FR_PRIVATE = 0x10
+
+# Windows字体API的延迟初始化单例：WinDLL加载和函数原型设置只做一次
+_win32_font_api = None
+
+
+def _get_win32_font_api():
+    """返回(AddFontResourceExW, user32)；非Windows或初始化失败返回None"""
+    global _win32_font_api
+    if _win32_font_api is None:
+        if platform.system() != 'Windows':
+            _win32_font_api = False
+        else:
+            try:
+                import ctypes
+                from ctypes import wintypes
+
+                gdi32 = ctypes.WinDLL('gdi32')
+                user32 = ctypes.WinDLL('user32')
+
+                add_font_resource_ex = gdi32.AddFontResourceExW
+                add_font_resource_ex.argtypes = [wintypes.LPCWSTR, wintypes.DWORD, wintypes.PVOID]
+                add_font_resource_ex.restype = wintypes.INT
+
+                _win32_font_api = (add_font_resource_ex, user32)
+            except Exception as e:
+                print(f"初始化Windows字体API失败: {e}")
+                _win32_font_api = False
+    return _win32_font_api or None
+
+
+def _broadcast_font_change(user32):
+    """广播一次WM_FONTCHANGE；用SendMessageTimeoutW避免挂起的窗口阻塞广播"""
+    SMTO_ABORTIFHUNG = 0x0002
+    try:
+        user32.SendMessageTimeoutW(_HWND_BROADCAST, _WM_FONTCHANGE, 0, 0,
+                                   SMTO_ABORTIFHUNG, 100, None)
+    except Exception:
+        user32.SendMessageW(_HWND_BROADCAST, _WM_FONTCHANGE, 0, 0)
 
 
 # --- 添加字体管理类 ---
 class FontManager:
+    # 系统字体在进程生命周期内基本不变，类级缓存避免重复调用tkFont.families()
+    _system_fonts_cache = None
+    # 本进程内已注册过的字体文件(按realpath去重)，重复注册直接跳过
+    _registered_font_paths = set()
+
     def __init__(self):
         """初始化字体管理器"""
         self.system_fonts = []
         self.custom_fonts = []
+        # 字体名集合：用于O(1)判断某字体是否可用
+        self._system_fonts_set = set()
+        self._custom_font_names = set()
         self.current_font = "Microsoft YaHei UI"  # 默认字体
         self.font_size = 15  # 默认字体大小
         self.config_path = Path("settings.ini")  # 配置文件路径
@@ -74,35 +239,48 @@ class FontManager:
 
     def load_system_fonts(self):
         """加载系统字体"""
+        # 优先使用类级缓存，避免重复枚举系统字体
+        if FontManager._system_fonts_cache is not None:
+            self.system_fonts = list(FontManager._system_fonts_cache)
+            self._system_fonts_set = set(self.system_fonts)
+            return
         try:
-            # 使用tkinter获取系统字体
-            font_families = list(tkFont.families())
-            # 过滤掉一些特殊字体
-            self.system_fonts = [f for f in font_families if not f.startswith('@') and f != 'MS Gothic']
-            self.system_fonts.sort()
+            # 使用tkinter获取系统字体，过滤掉一些特殊字体
+            self.system_fonts = sorted(
+                f for f in tkFont.families() if not f.startswith('@') and f != 'MS Gothic')
+            FontManager._system_fonts_cache = list(self.system_fonts)
         except Exception as e:
             print(f"加载系统字体时出错: {e}")
             self.system_fonts = ["Microsoft YaHei UI", "SimSun", "Arial", "Times New Roman"]
+        self._system_fonts_set = set(self.system_fonts)
 
     def load_custom_fonts_from_directory(self, directory_path):
         """从指定目录加载自定义字体文件"""
         self.custom_fonts = []
+        self._custom_font_names = set()
         try:
-            font_path = Path(directory_path)
-            if not font_path.exists() or not font_path.is_dir():
+            # 支持的字体文件扩展名
+            font_extensions = {'.ttf', '.otf', '.ttc', '.fon'}
+
+            # 单次scandir遍历目录查找字体文件，避免按扩展名多次glob
+            try:
+                with os.scandir(directory_path) as it:
+                    for entry in it:
+                        stem, ext = os.path.splitext(entry.name)
+                        if ext.lower() in font_extensions and entry.is_file():
+                            # 仅添加文件名（不含扩展名）作为字体名称
+                            self.custom_fonts.append({
+                                "name": stem,
+                                "path": entry.path
+                            })
+            except (OSError, NotADirectoryError):
                 return False
 
-            # 支持的字体文件扩展名
-            font_extensions = ['.ttf', '.otf', '.ttc', '.fon']
-
-            # 遍历目录查找字体文件
-            for ext in font_extensions:
-                for font_file in font_path.glob(f'*{ext}'):
-                    # 仅添加文件名（不含扩展名）作为字体名称
-                    self.custom_fonts.append({
-                        "name": font_file.stem,
-                        "path": str(font_file)
-                    })
+            self._custom_font_names = {f["name"] for f in self.custom_fonts}
+
+            # 批量注册找到的字体，只触发一次字体变化广播
+            if self.custom_fonts:
+                self.register_custom_fonts_batch(f["path"] for f in self.custom_fonts)
 
             return len(self.custom_fonts) > 0
         except Exception as e:
@@ -116,33 +294,23 @@ class FontManager:
             if not font_path_obj.exists() or not font_path_obj.is_file():
                 return False
 
-            # Windows平台尝试注册字体
-            system = platform.system()
-            if system == 'Windows':
-                # 使用Windows API尝试临时加载字体
-                import ctypes
-                from ctypes import wintypes
-
-                # Windows API常量
-                HWND_BROADCAST = 0xFFFF
-                WM_FONTCHANGE = 0x001D
-                FR_PRIVATE = 0x10
+            # Windows平台尝试注册字体(API句柄模块级缓存，只初始化一次)
+            api = _get_win32_font_api()
+            if api is not None:
+                add_font_resource_ex, user32 = api
 
-                gdi32 = ctypes.WinDLL('gdi32')
-                user32 = ctypes.WinDLL('user32')
-
-                # AddFontResourceEx函数
-                add_font_resource_ex = gdi32.AddFontResourceExW
-                add_font_resource_ex.argtypes = [wintypes.LPCWSTR, wintypes.DWORD, wintypes.PVOID]
-                add_font_resource_ex.restype = wintypes.INT
+                # 同一字体文件只注册一次
+                real_path = os.path.realpath(font_path_obj)
+                if real_path in FontManager._registered_font_paths:
+                    return True
 
                 # 尝试加载字体
-                font_path_str = str(font_path_obj)
-                result = add_font_resource_ex(font_path_str, FR_PRIVATE, 0)
+                result = add_font_resource_ex(str(font_path_obj), _FR_PRIVATE, 0)
 
                 # 通知应用字体变化
                 if result > 0:
-                    user32.SendMessageW(HWND_BROADCAST, WM_FONTCHANGE, 0, 0)
+                    FontManager._registered_font_paths.add(real_path)
+                    _broadcast_font_change(user32)
                     return True
 
             return False
@@ -150,6 +318,30 @@ class FontManager:
             print(f"注册自定义字体时出错: {e}")
             return False
 
+    def register_custom_fonts_batch(self, font_paths):
+        """批量注册自定义字体，全部加载完后只广播一次字体变化消息"""
+        registered = 0
+        api = _get_win32_font_api()
+        if api is None:
+            return registered
+
+        add_font_resource_ex, user32 = api
+        for font_path in font_paths:
+            try:
+                # 同一字体文件只注册一次
+                real_path = os.path.realpath(font_path)
+                if real_path in FontManager._registered_font_paths:
+                    continue
+                if add_font_resource_ex(str(font_path), _FR_PRIVATE, 0) > 0:
+                    FontManager._registered_font_paths.add(real_path)
+                    registered += 1
+            except Exception as e:
+                print(f"注册自定义字体时出错: {e}")
+
+        if registered:
+            _broadcast_font_change(user32)
+        return registered
+
     def get_all_fonts(self):
         """获取所有可用字体（系统或自定义，取决于设置）"""
         # 根据设置返回不同的字体集
@@ -167,15 +359,13 @@ class FontManager:
     def load_settings(self):
         """从配置文件加载字体设置"""
         try:
-            if self.config_path.exists():
-                config = configparser.ConfigParser()
-                config.read(self.config_path, encoding='utf-8')
-
+            config = _read_settings_config(self.config_path)
+            if config is not None:
                 if 'Fonts' in config:
                     if 'current_font' in config['Fonts']:
                         saved_font = config['Fonts']['current_font']
                         # 确保字体存在于系统中
-                        if saved_font in self.system_fonts or any(f['name'] == saved_font for f in self.custom_fonts):
+                        if saved_font in self._system_fonts_set or saved_font in self._custom_font_names:
                             self.current_font = saved_font
 
                     if 'font_size' in config['Fonts']:
@@ -185,7 +375,8 @@ class FontManager:
                             pass  # 使用默认值
 
                     if 'use_custom_fonts' in config['Fonts']:
-                        self.use_custom_fonts = config['Fonts'].getboolean('use_custom_fonts')
+                        self.use_custom_fonts = config['Fonts']['use_custom_fonts'].strip().lower() in (
+                            '1', 'true', 'yes', 'on')
 
                 if 'CustomFonts' in config:
                     # 加载上次使用的自定义字体文件夹
@@ -205,33 +396,32 @@ class FontManager:
     def save_settings(self, custom_fonts_folder=None):
         """保存字体设置到配置文件"""
         try:
-            config = configparser.ConfigParser()
-
-            # 尝试读取现有配置
-            if self.config_path.exists():
-                config.read(self.config_path, encoding='utf-8')
+            # 尝试读取现有配置(命中缓存时免去重新解析)，复制一份避免改动缓存
+            config = _read_settings_config(self.config_path)
+            config = {section: dict(options) for section, options in config.items()} if config else {}
 
-            # 确保Fonts节存在
-            if 'Fonts' not in config:
-                config['Fonts'] = {}
-
-            config['Fonts']['current_font'] = self.current_font
-            config['Fonts']['font_size'] = str(self.font_size)
-            config['Fonts']['use_custom_fonts'] = str(self.use_custom_fonts)
+            fonts = config.setdefault('Fonts', {})
+            fonts['current_font'] = self.current_font
+            fonts['font_size'] = str(self.font_size)
+            fonts['use_custom_fonts'] = str(self.use_custom_fonts)
 
             # 保存自定义字体文件夹
-            if 'CustomFonts' not in config:
-                config['CustomFonts'] = {}
-
             # 如果提供了新的文件夹路径，则使用它，否则使用当前路径
-            if custom_fonts_folder:
-                config['CustomFonts']['last_folder'] = custom_fonts_folder
-            else:
-                config['CustomFonts']['last_folder'] = str(self.custom_fonts_dir)
-
-            # 写入配置文件
+            custom = config.setdefault('CustomFonts', {})
+            custom['last_folder'] = custom_fonts_folder if custom_fonts_folder else str(self.custom_fonts_dir)
+
+            # 手动拼接INI文本，一次性写入配置文件
+            lines = []
+            for section, options in config.items():
+                lines.append(f"[{section}]")
+                for key, value in options.items():
+                    lines.append(f"{key} = {value}")
+                lines.append("")
             with open(self.config_path, 'w', encoding='utf-8') as f:
-                config.write(f)
+                f.write("\n".join(lines))
+
+            # 文件已变化，使缓存失效
+            _config_cache.clear()
 
             return True
         except Exception as e:
@@ -248,19 +438,21 @@ class MoveEntryDialog(ctk.CTkToplevel if HAS_CTK else Toplevel):
         self.geometry("450x250")  # 稍微调整尺寸
         self.transient(parent)
         self.grab_set()
-        # 设置窗口背景匹配主题
+        # 设置窗口背景匹配主题(外观模式只查询一次，后续复用局部变量)
+        is_light_mode = HAS_CTK and ctk.get_appearance_mode().lower() == 'light'
         if HAS_CTK:
             bg_color = ctk.ThemeManager.theme["CTkFrame"]["fg_color"]
-            mode_index = 0 if ctk.get_appearance_mode().lower() == 'light' else 1
+            mode_index = 0 if is_light_mode else 1
             dialog_bg = bg_color[mode_index] if isinstance(bg_color, (list, tuple)) else bg_color
             self.configure(fg_color=dialog_bg)
 
         self.result = None
         # 修正：如果 current_category 为 None（例如，从搜索结果移动），不过滤
         if current_category is not None:
-            self.existing_categories = sorted([cat for cat in existing_categories if cat != current_category])
+            self.existing_categories = sorted([cat for cat in existing_categories if cat != current_category],
+                                              key=str.lower)
         else:
-            self.existing_categories = sorted(existing_categories)
+            self.existing_categories = sorted(existing_categories, key=str.lower)
 
         # --- 控件 ---
         if HAS_CTK:
@@ -296,9 +488,9 @@ class MoveEntryDialog(ctk.CTkToplevel if HAS_CTK else Toplevel):
             ok_button.pack(side=tk.LEFT, padx=10)
             cancel_button = ctk.CTkButton(button_frame, text="取消", command=self.on_cancel, width=80,
                                           font=("Microsoft YaHei UI", 15),
-                                          fg_color="#E0E0E0" if ctk.get_appearance_mode().lower() == 'light' else "#505050",
+                                          fg_color="#E0E0E0" if is_light_mode else "#505050",
                                           # 根据主题调整取消按钮颜色
-                                          text_color="#303030" if ctk.get_appearance_mode().lower() == 'light' else "#D0D0D0")
+                                          text_color="#303030" if is_light_mode else "#D0D0D0")
             cancel_button.pack(side=tk.LEFT, padx=10)
         else:
             # 原始Tkinter版本实现 (保持不变)
@@ -354,7 +546,7 @@ class MoveEntryDialog(ctk.CTkToplevel if HAS_CTK else Toplevel):
             if new_category_name == "_trash":
                 messagebox.showerror("错误", "分类名称 '_trash' 是保留名称。", parent=self)
                 return
-            if re.search(r'[<>:"/\\|?*]', new_category_name) or any(ord(c) < 32 for c in new_category_name):
+            if _INVALID_NAME_RE.search(new_category_name):
                 messagebox.showerror("错误", "分类名称包含无效字符或控制字符。", parent=self)
                 return
             self.result = new_category_name
@@ -401,29 +593,31 @@ class TrashDialog(Toplevel):
         list_hl_bg, list_hl_color = None, None
         dialog_fg = 'white'  # 默认文本颜色改为白色，更适合深色背景
 
+        # 外观模式只查询一次，主题字典提取到局部变量复用
+        appearance_mode = ctk.get_appearance_mode().lower() if HAS_CTK else 'light'
         if HAS_CTK and isinstance(parent, ctk.CTk):
-            current_mode = ctk.get_appearance_mode().lower()
-            mode_index = 0 if current_mode == 'light' else 1
+            mode_index = 0 if appearance_mode == 'light' else 1
+            theme = ctk.ThemeManager.theme
 
-            bg_color = ctk.ThemeManager.theme["CTkFrame"]["fg_color"]
-            fg_color = ctk.ThemeManager.theme["CTkLabel"]["text_color"]
-            select_bg = ctk.ThemeManager.theme["CTkButton"]["fg_color"]
-            select_fg = ctk.ThemeManager.theme["CTkButton"]["text_color"]
+            bg_color = theme["CTkFrame"]["fg_color"]
+            fg_color = theme["CTkLabel"]["text_color"]
+            select_bg = theme["CTkButton"]["fg_color"]
+            select_fg = theme["CTkButton"]["text_color"]
 
             dialog_bg = bg_color[mode_index] if isinstance(bg_color, (list, tuple)) else bg_color
             dialog_fg = fg_color[mode_index] if isinstance(fg_color, (list, tuple)) else fg_color
             list_select_bg = select_bg[mode_index] if isinstance(select_bg, (list, tuple)) else select_bg
             list_select_fg = select_fg[mode_index] if isinstance(select_fg, (list, tuple)) else select_fg
-            list_bg = ctk.ThemeManager.theme["CTkTextbox"]["fg_color"][mode_index]
-            list_hl_bg = ctk.ThemeManager.theme["CTkFrame"]["border_color"][mode_index]
+            list_bg = theme["CTkTextbox"]["fg_color"][mode_index]
+            list_hl_bg = theme["CTkFrame"]["border_color"][mode_index]
             list_hl_color = list_select_bg
 
             self.configure(bg=dialog_bg)
             style.configure("TFrame", background=dialog_bg)
             style.configure("TLabel", background=dialog_bg, foreground=dialog_fg)
             # ttk按钮颜色仍可能受限
-            btn_bg = ctk.ThemeManager.theme["CTkButton"]["fg_color"][mode_index]
-            btn_fg = ctk.ThemeManager.theme["CTkButton"]["text_color"][mode_index]
+            btn_bg = theme["CTkButton"]["fg_color"][mode_index]
+            btn_fg = theme["CTkButton"]["text_color"][mode_index]
             style.map("TButton",
                       background=[('active', btn_bg), ('!disabled', btn_bg)],
                       foreground=[('active', btn_fg), ('!disabled', btn_fg)])
@@ -468,11 +662,12 @@ class TrashDialog(Toplevel):
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        self.item_map = {}
-        for item_path in sorted(trash_items, key=lambda p: p.name):
-            display_name = item_path.name
-            self.listbox.insert(tk.END, display_name)
-            self.item_map[display_name] = item_path
+        # list_trash已按文件名返回有序结果，这里无需再排序
+        display_names = [item_path.name for item_path in trash_items]
+        self.item_map = dict(zip(display_names, trash_items))
+        if display_names:
+            # 单次Tcl调用批量插入，避免逐项insert的跨界开销
+            self.listbox.insert(tk.END, *display_names)
 
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill=tk.X)
@@ -480,7 +675,7 @@ class TrashDialog(Toplevel):
         # 使用CTk按钮替代ttk按钮，确保按钮可见
         if HAS_CTK:
             # 获取当前主题模式和颜色
-            mode = "dark" if ctk.get_appearance_mode().lower() == "dark" else "light"
+            mode = "dark" if appearance_mode == "dark" else "light"
             # 从父窗口获取软色调颜色
             soft_colors = parent.soft_colors[mode] if hasattr(parent, 'soft_colors') else {
                 "button_blue": "#4a6f8a",
@@ -590,6 +785,30 @@ class TrashDialog(Toplevel):
         self.destroy()
 
 
+@functools.lru_cache(maxsize=4096)
+def _safe_filename_from_title(title):
+    """标题到安全文件名的纯函数转换；同一标题的结果直接走缓存"""
+    safe_title = _INVALID_CHARS_RE.sub("_", title)
+    safe_title = _WHITESPACE_RE.sub('_', safe_title)
+    safe_title = safe_title.strip('_. ')
+    if _RESERVED_DEVICE_RE.match(safe_title.upper()):
+        safe_title = "_" + safe_title
+    return safe_title if safe_title else "untitled"
+
+
+def _fast_move(src, dst):
+    """移动文件/目录：同一文件系统内用os.rename原子改名，跨设备时退回shutil.move"""
+    src = str(src)
+    dst = str(dst)
+    try:
+        os.rename(src, dst)
+    except OSError as e:
+        if e.errno == errno.EXDEV:
+            shutil.move(src, dst)
+        else:
+            raise
+
+
 # --- Backend Logic (NovelManager) ---
 # (代码与上一个版本相同，保持不变)
 class NovelManager:
@@ -597,8 +816,29 @@ class NovelManager:
         """Initialize novel manager using pathlib."""
         self.root_dir = Path(root_dir).resolve()
         self.trash_dir = self.root_dir / "_trash"
+        # 热路径上用字符串拼接路径，省去重复的Path构造
+        self._root_str = str(self.root_dir)
+        self._trash_str = str(self.trash_dir)
         self._ensure_directories()
         self.categories = self._load_categories()
+        # 分类名集合：与self.categories同步维护，供O(1)成员判断
+        self._categories_set = set(self.categories)
+        # 条目解析缓存：路径 -> (mtime_ns, size, metadata, content)，LRU淘汰
+        self._meta_cache = OrderedDict()
+        # 搜索并行读取时多个线程会访问缓存，需要加锁
+        self._meta_cache_lock = threading.Lock()
+        # 并行移动条目时对分类列表的注册/创建需要串行化
+        self._categories_lock = threading.Lock()
+        # 最近一次save_entry写入的元数据，界面保存后可直接取用
+        self.last_saved_metadata = None
+        # 搜索索引：分类 -> (目录mtime_ns, [(路径, 标题), ...])
+        self._search_index = {}
+        # 内容签名缓存：路径 -> (mtime_ns, size, trigram集合)，用于跳过不可能命中的全文读取
+        self._sig_cache = OrderedDict()
+        self._sig_cache_lock = threading.Lock()
+        # 批量模式：>0时新增分类先积累，退出时一次性合并排序
+        self._bulk_depth = 0
+        self._bulk_pending = set()
 
     def _ensure_directories(self):
         """Ensure base and trash directories exist."""
@@ -608,9 +848,11 @@ class NovelManager:
     def _load_categories(self):
         """Load categories from directories, excluding trash, and return sorted."""
         try:
-            cats = [d.name for d in self.root_dir.iterdir()
-                    if d.is_dir() and d.name != "_trash"]
-            cats.sort(key=lambda x: x.lower())  # Sort case-insensitively
+            # os.scandir复用目录遍历时的stat信息，避免每个条目再发起系统调用
+            with os.scandir(self.root_dir) as it:
+                cats = [entry.name for entry in it
+                        if entry.is_dir(follow_symlinks=False) and entry.name != "_trash"]
+            cats.sort(key=str.lower)  # Sort case-insensitively
             return cats
         except OSError as e:
             print(f"Error loading categories from {self.root_dir}: {e}")
@@ -619,13 +861,35 @@ class NovelManager:
 
     def _get_safe_filename(self, title):
         """Create a safe filename from a title."""
-        safe_title = re.sub(r'[<>:"/\\|?*]', "_", title)
-        safe_title = re.sub(r'\s+', '_', safe_title)
-        safe_title = safe_title.strip('_. ')
-        if safe_title.upper() in ("CON", "PRN", "AUX", "NUL") or \
-                re.match(r"^(COM|LPT)\d$", safe_title.upper()):
-            safe_title = "_" + safe_title
-        return safe_title if safe_title else "untitled"
+        return _safe_filename_from_title(title)
+
+    def _register_category(self, category):
+        """将新分类加入内存结构；批量模式下延迟到bulk()退出时统一排序"""
+        self._categories_set.add(category)
+        if self._bulk_depth:
+            self._bulk_pending.add(category)
+        else:
+            bisect.insort(self.categories, category, key=str.lower)
+
+    @contextlib.contextmanager
+    def bulk(self):
+        """批量导入/移动时使用：with manager.bulk(): ...
+
+        期间每个新增分类只记录，不逐项维护有序列表；退出时一次性
+        extend+排序，调用方随后刷新一次界面即可。
+        """
+        if self._bulk_depth == 0:
+            self._bulk_pending = set()
+        self._bulk_depth += 1
+        try:
+            yield self
+        finally:
+            self._bulk_depth -= 1
+            if self._bulk_depth == 0 and self._bulk_pending:
+                existing = set(self.categories)
+                self.categories.extend(c for c in self._bulk_pending if c not in existing)
+                self.categories.sort(key=str.lower)
+                self._bulk_pending = set()
 
     def _get_entry_path(self, category, title):
         """Get the Path object for a given category and title."""
@@ -649,18 +913,18 @@ class NovelManager:
         if not title:
             raise ValueError("标题不能为空")
 
-        # 确保分类存在
+        # 确保分类存在：已知分类直接跳过目录stat
         category_path = self.root_dir / category
-        if not category_path.is_dir():
-            try:
-                # 尝试创建分类目录
-                self.add_category(category)
-            except (ValueError, OSError) as e:
-                raise ValueError(f"无效或无法创建分类 '{category}': {e}")
-        elif category not in self.categories:
-            # 目录存在但不在列表中，添加它
-            self.categories.append(category)
-            self.categories.sort(key=lambda x: x.lower())
+        if category not in self._categories_set:
+            if not category_path.is_dir():
+                try:
+                    # 尝试创建分类目录
+                    self.add_category(category)
+                except (ValueError, OSError) as e:
+                    raise ValueError(f"无效或无法创建分类 '{category}': {e}")
+            else:
+                # 目录存在但不在列表中，添加它
+                self._register_category(category)
 
         # 准备元数据
         tags = tags or []
@@ -690,7 +954,10 @@ class NovelManager:
                     print(f"警告: 无法从 {existing_path} 读取元数据: {e}")
 
         # 准备文件内容 (JSON元数据 + 内容文本)
-        file_content = f"---\n{json.dumps(metadata, ensure_ascii=False, indent=2)}\n---\n\n{content}"
+        # 单行紧凑JSON：省掉缩进序列化和多余字节，解析端不受影响
+        # 头和正文分别编码，避免先拼接一份完整字符串再整体编码
+        header_bytes = f"---\n{_json_dumps(metadata)}\n---\n\n".encode("utf-8")
+        content_bytes = content.encode("utf-8")
 
         # 确保目标目录存在
         new_file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -715,17 +982,18 @@ class NovelManager:
         try:
             # 创建临时文件并写入内容
             temp_file_path = new_file_path.with_name(f"{new_file_path.stem}_temp{new_file_path.suffix}")
-            temp_file_path.write_text(file_content, encoding="utf-8")
+            # 预先编码后直接写字节，跳过文本IO层的包装开销
+            with open(temp_file_path, "wb") as f:
+                f.write(header_bytes)
+                f.write(content_bytes)
 
             # 检查并处理已存在的备份文件
             backup_path = new_file_path.with_name(f"{new_file_path.stem}_backup{new_file_path.suffix}")
-            if backup_path.exists():
-                try:
-                    # 如果备份文件存在，直接删除它
-                    backup_path.unlink()
-                    print(f"删除旧的备份文件: {backup_path}")
-                except Exception as e:
-                    print(f"警告: 无法删除旧的备份文件: {e}")
+            try:
+                # 如果备份文件存在，直接删除它(missing_ok省掉一次exists探测)
+                backup_path.unlink(missing_ok=True)
+            except Exception as e:
+                print(f"警告: 无法删除旧的备份文件: {e}")
 
             # 如果原文件存在，创建备份
             if new_file_path.exists():
@@ -735,14 +1003,23 @@ class NovelManager:
                 except Exception as e:
                     print(f"警告: 无法创建文件备份: {e}")
 
-            # 使用临时文件替换目标文件（原子操作，避免写入中断导致文件损坏）
-            shutil.move(str(temp_file_path), str(new_file_path))
+            # 使用临时文件替换目标文件（os.replace同目录原子重命名，避免写入中断导致文件损坏）
+            os.replace(temp_file_path, new_file_path)
+            self._invalidate_meta_cache(new_file_path)
+            # 刚写入的元数据/内容顺手入缓存并记录下来，保存后的界面刷新不用重读文件
+            self.last_saved_metadata = dict(metadata)
+            try:
+                st = os.stat(new_file_path)
+                self._meta_cache_store(str(new_file_path), st, metadata, content)
+            except OSError:
+                pass
             print(f"已保存文件: {new_file_path}")
 
             # 如果是更新且路径变化了（重命名或移动），删除原文件
             if existing_path and not is_same_file and existing_path.exists():
                 try:
                     existing_path.unlink()
+                    self._invalidate_meta_cache(existing_path)
                     print(f"已删除原文件: {existing_path}")
                 except OSError as del_e:
                     print(f"警告: 重命名/移动后无法删除原文件 '{existing_path}': {del_e}")
@@ -750,9 +1027,9 @@ class NovelManager:
             return str(new_file_path)
         except OSError as e:
             # 清理临时文件
-            if 'temp_file_path' in locals() and temp_file_path.exists():
+            if 'temp_file_path' in locals():
                 try:
-                    temp_file_path.unlink()
+                    temp_file_path.unlink(missing_ok=True)
                 except:
                     pass
             # 直接传递原始错误，不再包装
@@ -767,57 +1044,29 @@ class NovelManager:
         try:
             original_category = path.parent.name
             now_iso = datetime.datetime.now().isoformat()
-            metadata = {"title": path.stem}
-            content = ""
-            try:
-                entry_data = self.get_entry_by_path(path, read_content=True)
-                if entry_data:
-                    metadata = entry_data.get("metadata", metadata)
-                    content = entry_data.get("content", "")
-            except Exception as read_e:
-                print(f"Warning: Could not read data from {path} before trashing: {read_e}")
-
-            # Add trash metadata (no need to write back to original)
-            metadata["_original_category"] = original_category
-            metadata["_deleted_at"] = now_iso
-            # 添加原始文件名，便于恢复时精确还原
-            metadata["_original_filename"] = path.name
-            # 添加完整路径信息
-            metadata["_original_path"] = str(path)
-            # Ensure title field exists in metadata for trash filename
-            metadata["title"] = metadata.get("title", path.stem)
 
             # Define unique trash filename
+            # 时间戳加随机短token保证唯一，无需循环exists()探测
             ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            base_name = self._get_safe_filename(metadata["title"])  # Use metadata title
-            trash_filename = f"{ts}_{base_name}{path.suffix or '.md'}"
+            base_name = path.stem
+            trash_filename = f"{ts}_{secrets.token_hex(3)}_{base_name}{path.suffix or '.md'}"
             target_trash_path = self.trash_dir / trash_filename
 
-            counter = 0
-            while target_trash_path.exists():
-                counter += 1
-                trash_filename = f"{ts}_{base_name}_{counter}{path.suffix or '.md'}"
-                target_trash_path = self.trash_dir / trash_filename
-
-            # 先保存元数据到新文件，再移动
-            if path.suffix.lower() == ".md":
-                file_content = f"---\n{json.dumps(metadata, ensure_ascii=False, indent=2)}\n---\n\n{content}"
-                try:
-                    target_trash_path.write_text(file_content, encoding="utf-8")
-                    path.unlink()  # 删除原文件
-                    print(f"Created trashed file with metadata: {target_trash_path}")
-                    return True
-                except Exception as e:
-                    print(f"Error writing trash file, falling back to move: {e}")
-                    # 如果直接写入失败，回退到移动方法
-                    if target_trash_path.exists():
-                        try:
-                            target_trash_path.unlink()  # 清理失败的写入
-                        except:
-                            pass
+            # 不读取/改写文件内容：文件原样移动，恢复信息写入伴随的.meta.json
+            sidecar_meta = {
+                "_original_category": original_category,
+                "_deleted_at": now_iso,
+                "_original_filename": path.name,
+                "_original_path": str(path),
+            }
+            sidecar_path = target_trash_path.with_name(target_trash_path.name + ".meta.json")
+            try:
+                sidecar_path.write_bytes(_json_dumps(sidecar_meta).encode("utf-8"))
+            except Exception as e:
+                print(f"Warning: Could not write trash sidecar {sidecar_path}: {e}")
 
-            # Move the file if we didn't successfully write it
-            shutil.move(str(path), str(target_trash_path))
+            _fast_move(path, target_trash_path)
+            self._invalidate_meta_cache(path)
             print(f"Moved entry to trash: {target_trash_path}")
             return True
 
@@ -835,15 +1084,15 @@ class NovelManager:
             raise ValueError("不能使用 'move' 移动到回收站，请使用 'delete'。")
 
         target_category_path = self.root_dir / target_category
-        if not target_category_path.exists():
-            try:
-                self.add_category(target_category)  # Creates dir and adds to list
-            except (ValueError, OSError) as e:
-                raise OSError(f"无法创建目标分类 '{target_category}' 以进行移动: {e}")
-        elif target_category not in self.categories:
-            # Dir exists but not in list, add it
-            self.categories.append(target_category)
-            self.categories.sort(key=lambda x: x.lower())
+        with self._categories_lock:
+            if not target_category_path.exists():
+                try:
+                    self.add_category(target_category)  # Creates dir and adds to list
+                except (ValueError, OSError) as e:
+                    raise OSError(f"无法创建目标分类 '{target_category}' 以进行移动: {e}")
+            elif target_category not in self._categories_set:
+                # Dir exists but not in list, add it
+                self._register_category(target_category)
 
         new_path = target_category_path / entry_path.name
 
@@ -851,75 +1100,263 @@ class NovelManager:
             raise FileExistsError(f"目标位置已存在同名文件: {new_path}")
 
         try:
-            shutil.move(str(entry_path), str(new_path))
+            _fast_move(entry_path, new_path)
+            self._invalidate_meta_cache(entry_path, new_path)
             return str(new_path)
         except Exception as e:
             raise OSError(f"无法移动文件 '{entry_path}' 到 '{new_path}': {e}")
 
+    def _category_file_index(self, category):
+        """返回分类下的 (路径, 标题) 列表；目录mtime未变化时直接复用内存索引。
+
+        目录内文件的新增/删除/改写（本应用写入都经过os.replace）都会刷新
+        目录mtime，因此以它作为失效依据即可。
+        """
+        category_path = os.path.join(self._root_str, category)
+        try:
+            dir_mtime = os.stat(category_path).st_mtime_ns
+        except OSError:
+            self._search_index.pop(category, None)
+            return []
+
+        cached = self._search_index.get(category)
+        if cached is not None and cached[0] == dir_mtime:
+            return cached[1]
+
+        # 单次scandir收集md文件路径字符串，省去逐项Path构造和glob匹配
+        try:
+            with os.scandir(category_path) as it:
+                md_files = [e.path for e in it
+                            if e.name.endswith(".md") and e.is_file(follow_symlinks=False)]
+        except OSError:
+            return []
+
+        files = []
+        for file_path in md_files:
+            try:
+                entry_data = self.get_entry_by_path(file_path, read_content=False)
+                title = os.path.splitext(os.path.basename(file_path))[0]
+                if entry_data and entry_data.get("metadata") and entry_data["metadata"].get("title"):
+                    title = entry_data["metadata"]["title"]
+                files.append((file_path, title))
+            except Exception as e:
+                print(f"Error indexing file {file_path}: {e}")
+
+        self._search_index[category] = (dir_mtime, files)
+        return files
+
+    # 内容签名缓存的容量上限；超大正文不建签名，避免占用过多内存
+    _SIG_CACHE_MAX = 4096
+    _SIG_CONTENT_MAX = 512 * 1024
+
+    def _content_signature(self, file_path):
+        """返回文件内容的trigram签名；缓存缺失或已失效时返回None"""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        with self._sig_cache_lock:
+            cached = self._sig_cache.get(file_path)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return cached[2]
+        return None
+
+    def _store_content_signature(self, file_path, content):
+        """在全文已读入内存时顺便记录trigram签名，供后续搜索跳过整读"""
+        if len(content) > self._SIG_CONTENT_MAX:
+            return
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return
+        text = content.lower()
+        grams = frozenset(text[i:i + 3] for i in range(len(text) - 2))
+        with self._sig_cache_lock:
+            cache = self._sig_cache
+            cache[file_path] = (st.st_mtime_ns, st.st_size, grams)
+            cache.move_to_end(file_path)
+            while len(cache) > self._SIG_CACHE_MAX:
+                cache.popitem(last=False)
+
     def search(self, query, categories=None):
         """Search content across specified categories (or all)."""
         results = []
-        search_query = query.lower().strip()
+        search_query = query.strip()
         if not search_query: return results
 
+        # 编译一次忽略大小写的模式，匹配时无需对标题/全文做lower()拷贝
+        query_re = re.compile(re.escape(search_query), re.IGNORECASE)
+
         search_categories = categories if categories is not None else self.categories
 
+        # 标题匹配直接由内存索引完成；只有未命中的文件才需要读正文
+        # 结果带着预计算的小写排序键（装饰-排序-还原），分类的lower每类只算一次
+        decorated = []
+        content_tasks = []
         for category in search_categories:
-            category_path = self.root_dir / category
-            if not category_path.is_dir(): continue
+            category_lc = category.lower()
+            for file_path, title in self._category_file_index(category):
+                if query_re.search(title) is not None:
+                    decorated.append((category_lc, title.lower(), file_path, {
+                        "category": category,
+                        "title": title,
+                        "path": file_path
+                    }))
+                else:
+                    content_tasks.append((category, category_lc, file_path, title))
 
-            for file_path in category_path.glob("*.md"):
-                try:
-                    # Read metadata first for title
-                    entry_data = self.get_entry_by_path(file_path, read_content=False)
-                    title = file_path.stem
-                    if entry_data and entry_data.get("metadata") and entry_data["metadata"].get("title"):
-                        title = entry_data["metadata"]["title"]
-
-                    title_match = search_query in title.lower()
-                    content_match = False
-
-                    if not title_match:
-                        # Read content only if title didn't match
-                        entry_data_full = self.get_entry_by_path(file_path, read_content=True)
-                        content = entry_data_full.get("content", "") if entry_data_full else ""
-                        content_match = search_query in content.lower()
-
-                    if title_match or content_match:
-                        results.append({
-                            "category": category,
-                            "title": title,
-                            "path": str(file_path)
-                        })
-                except Exception as e:
-                    print(f"Error processing file {file_path} during search: {e}")
-                    continue
+        # 查询的trigram集合：签名缓存命中的文件若缺少任一trigram，必然不含该子串
+        lowered_query = search_query.lower()
+        query_grams = (frozenset(lowered_query[i:i + 3] for i in range(len(lowered_query) - 2))
+                       if len(lowered_query) >= 3 else None)
+
+        def check_content(task):
+            category, category_lc, file_path, title = task
+            try:
+                if query_grams is not None:
+                    sig = self._content_signature(file_path)
+                    if sig is not None and not query_grams.issubset(sig):
+                        return None  # 签名排除，无需读取正文
+                entry_data_full = self.get_entry_by_path(file_path, read_content=True)
+                content = entry_data_full.get("content", "") if entry_data_full else ""
+                self._store_content_signature(file_path, content)
+                if query_re.search(content) is not None:
+                    return (category_lc, title.lower(), file_path, {
+                        "category": category,
+                        "title": title,
+                        "path": file_path
+                    })
+            except Exception as e:
+                print(f"Error processing file {file_path} during search: {e}")
+            return None
+
+        # 文件很少时线程池开销得不偿失，保持串行；文件多时并行读盘
+        if len(content_tasks) < 8:
+            matched = map(check_content, content_tasks)
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as executor:
+                matched = list(executor.map(check_content, content_tasks))
 
-        results.sort(key=lambda x: (x["category"].lower(), x["title"].lower()))
+        decorated.extend(r for r in matched if r is not None)
+        # 元组自然排序即可，路径作为唯一的决胜键，不会比较到字典
+        decorated.sort()
+        results = [item[3] for item in decorated]
         return results
 
+    def _read_front_matter(self, path):
+        """分块读取文件开头的JSON元数据块，找到结束围栏即停止，不读取正文。
+
+        返回元数据字符串；文件没有元数据块时返回""；读取出错返回None。
+        """
+        try:
+            with open(path, 'rb') as f:
+                buf = f.read(4096)
+                if not buf.startswith(b'---'):
+                    return ""
+                first_nl = buf.find(b'\n')
+                while first_nl == -1:
+                    chunk = f.read(8192)
+                    if not chunk:
+                        return ""
+                    buf += chunk
+                    first_nl = buf.find(b'\n')
+
+                search_from = first_nl + 1
+                while True:
+                    idx = buf.find(b'\n---', search_from)
+                    if idx != -1:
+                        return buf[first_nl + 1:idx].decode('utf-8', errors='replace').strip()
+                    # 元数据块不可能这么大；没找到围栏时放弃，避免把超大文件整个读完
+                    if len(buf) >= 256 * 1024:
+                        return ""
+                    chunk = f.read(8192)
+                    if not chunk:
+                        # 没有结束围栏，视为无有效元数据块
+                        return ""
+                    # 回退几个字节，避免围栏刚好跨在块边界上漏检
+                    search_from = max(first_nl + 1, len(buf) - len(b'\n---') + 1)
+                    buf += chunk
+        except OSError as e:
+            print(f"Error reading file {path}: {e}")
+            return None
+
+    # 条目解析缓存的容量上限
+    _META_CACHE_MAX = 2048
+
+    def _meta_cache_store(self, key, st, metadata, content_text):
+        """写入条目解析缓存并做LRU淘汰"""
+        with self._meta_cache_lock:
+            cache = self._meta_cache
+            cache[key] = (st.st_mtime_ns, st.st_size, metadata, content_text)
+            cache.move_to_end(key)
+            while len(cache) > self._META_CACHE_MAX:
+                cache.popitem(last=False)
+
+    def _invalidate_meta_cache(self, *paths):
+        """移动/删除/改写文件后丢弃对应的缓存条目"""
+        with self._meta_cache_lock:
+            for p in paths:
+                self._meta_cache.pop(str(p), None)
+
     def get_entry_by_path(self, file_path_str, read_content=True):
         """Get entry data (metadata and optionally content) from a file path."""
-        path = Path(file_path_str)
-        if not path.exists() or not path.is_file():
+        key = str(file_path_str)
+        try:
+            st = os.stat(key)
+        except OSError:
+            return None
+        if not stat.S_ISREG(st.st_mode):
             return None
 
+        # 命中缓存：mtime和大小都未变化时直接复用解析结果
+        with self._meta_cache_lock:
+            cached = self._meta_cache.get(key)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                metadata, content_text = cached[2], cached[3]
+                if not read_content or content_text is not None:
+                    self._meta_cache.move_to_end(key)
+                    entry_data = {"metadata": dict(metadata), "path": key}
+                    if read_content:
+                        entry_data["content"] = content_text
+                    return entry_data
+
+        path = Path(key)
+        metadata = {"title": path.stem}  # Default title from filename
+
+        if not read_content:
+            # 只需要元数据时做有界读取，大文件无需整体载入
+            metadata_str = self._read_front_matter(path)
+            if metadata_str is None:
+                return None
+            if metadata_str:
+                try:
+                    loaded_meta = _json_loads(metadata_str)
+                    if isinstance(loaded_meta, dict):
+                        if not loaded_meta.get("title"):
+                            loaded_meta["title"] = path.stem
+                        metadata = loaded_meta
+                    else:
+                        print(f"Warning: Metadata in {path} is not a JSON object.")
+                except json.JSONDecodeError as json_e:
+                    print(f"Warning: Invalid JSON metadata in {path}: {json_e}")
+            self._meta_cache_store(key, st, metadata, None)
+            return {"metadata": dict(metadata), "path": key}
+
         try:
             full_content = path.read_text(encoding="utf-8")
         except Exception as e:
             print(f"Error reading file {path}: {e}")
             return None
 
-        metadata = {"title": path.stem}  # Default title from filename
         content_text = full_content
 
         if full_content.startswith("---"):
-            match = re.match(r"^---\s*?\n(.*?)\n^---\s*?\n?(.*)", full_content, re.MULTILINE | re.DOTALL)
+            match = _FRONT_MATTER_RE.match(full_content)
             if match:
                 metadata_str = match.group(1).strip()
                 content_text = match.group(2).strip()
                 try:
-                    loaded_meta = json.loads(metadata_str)
+                    loaded_meta = _json_loads(metadata_str)
                     if isinstance(loaded_meta, dict):
                         # Use metadata title, fallback to filename stem if missing/empty
                         if not loaded_meta.get("title"):
@@ -932,33 +1369,41 @@ class NovelManager:
             else:
                 print(f"Warning: Malformed metadata block in {path}.")
 
+        self._meta_cache_store(key, st, metadata, content_text)
+
         entry_data = {
-            "metadata": metadata,
-            "path": str(path)
+            "metadata": dict(metadata),
+            "path": key,
+            "content": content_text
         }
-        if read_content:
-            entry_data["content"] = content_text
 
         return entry_data
 
     def list_entries(self, category):
         """List titles and paths of entries in a category, sorted."""
         entries = []
-        category_path = self.root_dir / category
-        if not category_path.is_dir(): return entries
-
-        for file_path in category_path.glob("*.md"):
-            # 忽略备份文件
-            if "_backup" in file_path.stem:
-                continue
+        category_path = os.path.join(self._root_str, category)
 
+        # 单次scandir收集md文件路径字符串，忽略备份文件
+        try:
+            with os.scandir(category_path) as it:
+                md_files = [e.path for e in it
+                            if e.name.endswith(".md") and "_backup" not in e.name
+                            and e.is_file(follow_symlinks=False)]
+        except OSError:
+            return entries
+
+        # 装饰-排序-还原：小写键在append时算好，排序直接比较元组
+        decorated = []
+        for file_path in md_files:
             entry_data = self.get_entry_by_path(file_path, read_content=False)
-            title = file_path.stem
+            title = os.path.splitext(os.path.basename(file_path))[0]
             if entry_data and entry_data.get("metadata") and entry_data["metadata"].get("title"):
                 title = entry_data["metadata"]["title"]
-            entries.append({"title": title, "path": str(file_path)})
+            decorated.append((title.lower(), file_path, {"title": title, "path": file_path}))
 
-        entries.sort(key=lambda x: x["title"].lower())  # Sort case-insensitively
+        decorated.sort()  # Sort case-insensitively
+        entries = [item[2] for item in decorated]
         return entries
 
     def add_category(self, new_category):
@@ -966,15 +1411,14 @@ class NovelManager:
         clean_category = new_category.strip()
         if not clean_category: raise ValueError("分类名称不能为空。")
         if clean_category == "_trash": raise ValueError("分类名称 '_trash' 是保留名称。")
-        if re.search(r'[<>:"/\\|?*]', clean_category) or any(ord(c) < 32 for c in clean_category):
+        if _INVALID_NAME_RE.search(clean_category):
             raise ValueError(f"分类名称 '{clean_category}' 包含无效字符。")
 
         category_path = self.root_dir / clean_category
-        if clean_category not in self.categories:
+        if clean_category not in self._categories_set:
             try:
                 category_path.mkdir(exist_ok=True)
-                self.categories.append(clean_category)
-                self.categories.sort(key=lambda x: x.lower())
+                self._register_category(clean_category)
                 return True
             except OSError as e:
                 raise OSError(f"无法创建分类目录 '{clean_category}': {e}")
@@ -985,20 +1429,21 @@ class NovelManager:
 
     def remove_category(self, category):
         """Move a category directory and its contents to the trash."""
-        if category not in self.categories:
+        if category not in self._categories_set:
             raise ValueError(f"分类 '{category}' 不存在。")
 
         category_path = self.root_dir / category
         if category_path.is_dir():
             try:
                 target_trash_path = self.trash_dir / category_path.name
-                counter = 0
-                while target_trash_path.exists():
-                    counter += 1
-                    target_trash_path = self.trash_dir / f"{category_path.name}_{counter}"
+                if target_trash_path.exists():
+                    # 同名目录已在回收站：附加随机token一次性避开冲突
+                    target_trash_path = self.trash_dir / f"{category_path.name}_{secrets.token_hex(3)}"
 
-                shutil.move(str(category_path), str(target_trash_path))
+                _fast_move(category_path, target_trash_path)
                 self.categories.remove(category)  # Update internal list
+                self._categories_set.discard(category)
+                self._search_index.pop(category, None)
                 print(f"Moved category to trash: {target_trash_path}")
                 return True
             except Exception as e:
@@ -1007,6 +1452,8 @@ class NovelManager:
             # Directory missing, but in list? Remove from list.
             print(f"Warning: Category '{category}' in list but directory missing. Removing from list.")
             self.categories.remove(category)
+            self._categories_set.discard(category)
+            self._search_index.pop(category, None)
             return True
 
     def rename_category(self, current_name, new_name):
@@ -1015,10 +1462,10 @@ class NovelManager:
         if not clean_new_name: raise ValueError("新分类名称不能为空。")
         if clean_new_name == current_name: return True  # No change
         if clean_new_name == "_trash": raise ValueError("新分类名称 '_trash' 是保留名称。")
-        if clean_new_name in self.categories: raise ValueError(f"目标分类名称 '{clean_new_name}' 已存在。")
-        if re.search(r'[<>:"/\\|?*]', clean_new_name) or any(ord(c) < 32 for c in clean_new_name):
+        if clean_new_name in self._categories_set: raise ValueError(f"目标分类名称 '{clean_new_name}' 已存在。")
+        if _INVALID_NAME_RE.search(clean_new_name):
             raise ValueError(f"新分类名称 '{clean_new_name}' 包含无效字符。")
-        if current_name not in self.categories: raise ValueError(f"源分类 '{current_name}' 不存在。")
+        if current_name not in self._categories_set: raise ValueError(f"源分类 '{current_name}' 不存在。")
 
         old_path = self.root_dir / current_name
         new_path = self.root_dir / clean_new_name
@@ -1027,7 +1474,9 @@ class NovelManager:
             # Dir missing, just rename in list
             print(f"Warning: Directory '{current_name}' not found. Renaming in list only.")
             self.categories[self.categories.index(current_name)] = clean_new_name
-            self.categories.sort(key=lambda x: x.lower())
+            self.categories.sort(key=str.lower)
+            self._categories_set.discard(current_name)
+            self._categories_set.add(clean_new_name)
             return True
 
         if new_path.exists():
@@ -1036,9 +1485,12 @@ class NovelManager:
             raise FileExistsError(f"目标分类目录 '{clean_new_name}' 已物理存在。")
 
         try:
-            shutil.move(str(old_path), str(new_path))
+            _fast_move(old_path, new_path)
             self.categories[self.categories.index(current_name)] = clean_new_name
-            self.categories.sort(key=lambda x: x.lower())
+            self.categories.sort(key=str.lower)
+            self._categories_set.discard(current_name)
+            self._categories_set.add(clean_new_name)
+            self._search_index.pop(current_name, None)
             return True
         except Exception as e:
             raise OSError(f"无法重命名分类 '{current_name}' 为 '{clean_new_name}': {e}")
@@ -1047,44 +1499,79 @@ class NovelManager:
 
     def list_trash(self):
         """List all items directly inside the trash directory."""
-        if not self.trash_dir.exists(): return []
         # Filter out common system hidden files
-        return sorted([p for p in self.trash_dir.iterdir() if not p.name.startswith('.')],
-                      key=lambda p: p.name)
+        try:
+            with os.scandir(self.trash_dir) as it:
+                # .meta.json是删除条目时写入的恢复信息sidecar，不作为独立项目展示
+                names = [e.name for e in it
+                         if not e.name.startswith('.') and not e.name.endswith('.meta.json')]
+        except OSError:
+            return []
+        # 同一目录下按文件名排序即可，纯字符串排序无需key函数
+        names.sort()
+        trash_dir = self.trash_dir
+        return [trash_dir / name for name in names]
 
     def restore_trash_item(self, trash_path_str):
         """Restore a single item from the trash."""
         trash_path = Path(trash_path_str)
-        if not trash_path.exists() or self.trash_dir not in trash_path.parents:
+        # 单次lstat同时确认存在性和类型，避免exists/is_file/is_dir多次系统调用
+        try:
+            trash_mode = os.lstat(trash_path).st_mode
+        except OSError:
+            trash_mode = None
+        if trash_mode is None or self.trash_dir not in trash_path.parents:
             raise FileNotFoundError(f"回收站项目不存在或路径无效: {trash_path}")
+        trash_is_file = stat.S_ISREG(trash_mode)
 
         target_path = None
         original_path_str = None
+        sidecar_path = None
         debug_info = []  # 调试信息收集
 
         debug_info.append(f"开始恢复: {trash_path}")
 
         # Handle .md files (restore to original category if possible)
-        if trash_path.is_file() and trash_path.suffix == ".md":
-            entry_data = self.get_entry_by_path(trash_path, read_content=True)
-            debug_info.append(f"读取元数据: {entry_data is not None}")
-
-            # 尝试从元数据中获取原始路径
-            if entry_data and entry_data.get("metadata"):
-                metadata = entry_data.get("metadata", {})
-                original_path_str = metadata.get("_original_path")
-                original_category = metadata.get("_original_category")
-                original_filename = metadata.get("_original_filename")
-                content = entry_data.get("content", "")
-
-                debug_info.append(f"原始路径: {original_path_str}")
-                debug_info.append(f"原始分类: {original_category}")
-                debug_info.append(f"原始文件名: {original_filename}")
-            else:
-                debug_info.append("未找到元数据或读取失败")
-                original_category = None
-                original_filename = None
+        if trash_is_file and trash_path.suffix == ".md":
+            entry_data = None
+
+            # 优先读取sidecar中的恢复信息(删除时未改写文件内容)
+            sidecar_candidate = trash_path.with_name(trash_path.name + ".meta.json")
+            sidecar_meta = None
+            if sidecar_candidate.exists():
+                try:
+                    sidecar_meta = _json_loads(sidecar_candidate.read_text(encoding="utf-8"))
+                    sidecar_path = sidecar_candidate
+                    debug_info.append("使用sidecar恢复信息")
+                except Exception as e:
+                    debug_info.append(f"读取sidecar失败: {e}")
+
+            if isinstance(sidecar_meta, dict):
+                original_path_str = sidecar_meta.get("_original_path")
+                original_category = sidecar_meta.get("_original_category")
+                original_filename = sidecar_meta.get("_original_filename")
                 content = ""
+            else:
+                # 旧格式回收站文件：恢复信息内嵌在文件元数据里
+                entry_data = self.get_entry_by_path(trash_path, read_content=True)
+                debug_info.append(f"读取元数据: {entry_data is not None}")
+
+                # 尝试从元数据中获取原始路径
+                if entry_data and entry_data.get("metadata"):
+                    metadata = entry_data.get("metadata", {})
+                    original_path_str = metadata.get("_original_path")
+                    original_category = metadata.get("_original_category")
+                    original_filename = metadata.get("_original_filename")
+                    content = entry_data.get("content", "")
+
+                    debug_info.append(f"原始路径: {original_path_str}")
+                    debug_info.append(f"原始分类: {original_category}")
+                    debug_info.append(f"原始文件名: {original_filename}")
+                else:
+                    debug_info.append("未找到元数据或读取失败")
+                    original_category = None
+                    original_filename = None
+                    content = ""
 
             # 如果有原始路径，尝试直接使用
             if original_path_str:
@@ -1111,10 +1598,9 @@ class NovelManager:
                     except Exception as e:
                         debug_info.append(f"重建分类 '{original_category}' 失败: {e}")
                         target_category_path = self.root_dir
-                elif original_category not in self.categories:
+                elif original_category not in self._categories_set:
                     # Add to list if dir exists but wasn't listed
-                    self.categories.append(original_category)
-                    self.categories.sort(key=lambda x: x.lower())
+                    self._register_category(original_category)
                     debug_info.append(f"分类目录已存在但不在列表中，已添加: {original_category}")
 
                 # 确定目标文件名
@@ -1123,7 +1609,7 @@ class NovelManager:
                     debug_info.append(f"使用原始文件名构建目标路径: {target_path}")
                 else:
                     # 尝试从回收站文件名还原原始文件名
-                    original_filename_match = re.match(r"^\d{8}_\d{6}(?:_\d+)?_(.*)", trash_path.name)
+                    original_filename_match = _TRASH_TS_RE.match(trash_path.name)
                     base_filename = original_filename_match.group(1) if original_filename_match else trash_path.name
                     target_path = target_category_path / base_filename
                     debug_info.append(f"从垃圾文件名推导目标路径: {target_path}")
@@ -1133,24 +1619,23 @@ class NovelManager:
                 debug_info.append("无法确定原始位置，回退到根目录")
 
                 # 尝试从回收站文件名还原原始文件名
-                original_filename_match = re.match(r"^\d{8}_\d{6}(?:_\d+)?_(.*)", trash_path.name)
+                original_filename_match = _TRASH_TS_RE.match(trash_path.name)
                 base_filename = original_filename_match.group(1) if original_filename_match else trash_path.name
                 target_path = self.root_dir / base_filename
                 debug_info.append(f"目标路径设为根目录: {target_path}")
 
         # Handle directories (restore to root)
-        elif trash_path.is_dir():
-            category_name = re.sub(r'_\d+$', '', trash_path.name)  # Remove potential _1, _2 suffix
+        elif stat.S_ISDIR(trash_mode):
+            category_name = _DIR_SUFFIX_RE.sub('', trash_path.name)  # Remove potential _1, _2 suffix
             target_path = self.root_dir / category_name
             debug_info.append(f"恢复目录，目标路径: {target_path}")
 
             # Add category back to list if necessary (use cleaned name)
-            if category_name not in self.categories:
+            if category_name not in self._categories_set:
                 # 修复：先创建目录，然后再添加到列表
                 try:
                     (self.root_dir / category_name).mkdir(exist_ok=True)
-                    self.categories.append(category_name)
-                    self.categories.sort(key=lambda x: x.lower())
+                    self._register_category(category_name)
                     debug_info.append(f"重建分类目录: {category_name}")
                 except Exception as e:
                     debug_info.append(f"创建分类目录 '{category_name}' 失败: {e}")
@@ -1163,29 +1648,31 @@ class NovelManager:
 
         # Handle name collisions at target location
         if target_path:
-            counter = 0
-            original_target_path = target_path
-            while target_path.exists():
-                counter += 1
-                debug_info.append(f"文件名冲突，尝试生成替代名 (计数器: {counter})")
-
-                # 修复：使用与新建文件相同的命名方式，确保在文件名冲突时生成合适的文件名
-                if target_path.is_file() and target_path.suffix == ".md":
-                    # 使用时间戳和计数器生成一个唯一的文件名，类似于新建文件
+            # 目标位置也只stat一次，同时得到存在性和类型
+            try:
+                target_mode = os.lstat(target_path).st_mode
+            except OSError:
+                target_mode = None
+            if target_mode is not None:
+                # 随机token保证唯一，单次生成即可，不再循环探测
+                debug_info.append("文件名冲突，生成替代名")
+                original_target_path = target_path
+                if stat.S_ISREG(target_mode) and target_path.suffix == ".md":
+                    # 使用时间戳和token生成一个唯一的文件名，类似于新建文件
                     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
                     base_name = original_target_path.stem
-                    target_path = original_target_path.parent / f"{timestamp}_{counter}_{base_name}{original_target_path.suffix}"
+                    target_path = original_target_path.parent / f"{timestamp}_{secrets.token_hex(3)}_{base_name}{original_target_path.suffix}"
                 else:
-                    # 对于目录或其他文件类型，使用简单的计数器
+                    # 对于目录或其他文件类型，附加token后缀
                     stem = original_target_path.stem
-                    suffix = original_target_path.suffix if not original_target_path.is_dir() else ""
-                    target_path = original_target_path.parent / f"{stem}_{counter}{suffix}"
+                    suffix = original_target_path.suffix if not stat.S_ISDIR(target_mode) else ""
+                    target_path = original_target_path.parent / f"{stem}_{secrets.token_hex(3)}{suffix}"
 
                 debug_info.append(f"生成的新目标路径: {target_path}")
 
             try:
                 # 如果是 .md 文件，先清理元数据再保存到新位置
-                if trash_path.is_file() and trash_path.suffix == ".md" and entry_data:
+                if trash_is_file and trash_path.suffix == ".md" and entry_data:
                     debug_info.append("清理元数据并直接写入新文件")
                     metadata = entry_data.get("metadata", {}).copy()
                     # 清理内部标记
@@ -1194,17 +1681,27 @@ class NovelManager:
                     metadata.pop("_original_filename", None)
                     metadata.pop("_original_path", None)
 
-                    # 重新保存文件
-                    file_content = f"---\n{json.dumps(metadata, ensure_ascii=False, indent=2)}\n---\n\n{content}"
-                    target_path.write_text(file_content, encoding="utf-8")
+                    # 重新保存文件：头和正文分别编码直接写字节
+                    with open(target_path, "wb") as f:
+                        f.write(f"---\n{json.dumps(metadata, ensure_ascii=False, indent=2)}\n---\n\n".encode("utf-8"))
+                        f.write(content.encode("utf-8"))
                     # 删除原来的垃圾文件
                     trash_path.unlink()
                     debug_info.append(f"文件已恢复到: {target_path}")
                 else:
-                    # 对于非 .md 文件或没有元数据的情况，使用移动
-                    shutil.move(str(trash_path), str(target_path))
+                    # 对于非 .md 文件、sidecar恢复或没有元数据的情况，使用移动
+                    _fast_move(trash_path, target_path)
                     debug_info.append(f"文件已移动到: {target_path}")
 
+                self._invalidate_meta_cache(trash_path, target_path)
+
+                # 清理sidecar恢复信息文件
+                if sidecar_path is not None and sidecar_path.exists():
+                    try:
+                        sidecar_path.unlink()
+                    except OSError as e:
+                        debug_info.append(f"清理sidecar失败: {e}")
+
                 print(f"Restored '{trash_path.name}' to '{target_path}'")
                 print(f"Debug info: {'; '.join(debug_info)}")
                 return str(target_path)
@@ -1217,37 +1714,110 @@ class NovelManager:
             raise ValueError(f"无法确定 '{trash_path.name}' 的恢复位置。")
 
     def _cleanup_restored_metadata(self, file_path):
-        """Remove internal trash metadata keys from a restored file."""
+        """Remove internal trash metadata keys from a restored file.
+
+        只重写文件开头的元数据块，正文部分用流式拷贝搬运，不整体载入内存。
+        """
         try:
-            entry_data = self.get_entry_by_path(file_path, read_content=True)
-            if entry_data and isinstance(entry_data.get("metadata"), dict):
-                metadata = entry_data["metadata"]
-                metadata.pop("_original_category", None)
-                metadata.pop("_deleted_at", None)
-                content = entry_data.get("content", "")
-                # Re-save the file
-                file_content = f"---\n{json.dumps(metadata, ensure_ascii=False, indent=2)}\n---\n\n{content}"
-                file_path.write_text(file_content, encoding="utf-8")
-            elif entry_data:
+            file_path = Path(file_path)
+            # 定位元数据块边界，得到正文起始偏移
+            with open(file_path, 'rb') as f:
+                buf = f.read(4096)
+                if not buf.startswith(b'---'):
+                    return
+                first_nl = buf.find(b'\n')
+                while first_nl == -1:
+                    chunk = f.read(8192)
+                    if not chunk:
+                        return
+                    buf += chunk
+                    first_nl = buf.find(b'\n')
+
+                search_from = first_nl + 1
+                idx = -1
+                while True:
+                    idx = buf.find(b'\n---', search_from)
+                    if idx != -1:
+                        break
+                    if len(buf) >= 256 * 1024:
+                        return
+                    chunk = f.read(8192)
+                    if not chunk:
+                        return
+                    search_from = max(first_nl + 1, len(buf) - len(b'\n---') + 1)
+                    buf += chunk
+
+                # 围栏行的行尾即正文偏移；保存格式在围栏后还有一个空行
+                fence_end = buf.find(b'\n', idx + 1)
+                while fence_end == -1:
+                    chunk = f.read(8192)
+                    if not chunk:
+                        fence_end = len(buf) - 1
+                        break
+                    buf += chunk
+                    fence_end = buf.find(b'\n', idx + 1)
+                body_offset = fence_end + 1
+                if body_offset < len(buf) and buf[body_offset:body_offset + 1] == b'\n':
+                    body_offset += 1
+
+            metadata_str = buf[first_nl + 1:idx].decode('utf-8', errors='replace').strip()
+            if not metadata_str:
+                return
+            metadata = _json_loads(metadata_str)
+            if not isinstance(metadata, dict):
                 print(f"Info: No valid metadata dict found in {file_path} during cleanup.")
+                return
+
+            removed = False
+            for key in ("_original_category", "_deleted_at"):
+                if key in metadata:
+                    del metadata[key]
+                    removed = True
+            if not removed:
+                return  # 没有内部标记，无需重写
+
+            # 新元数据块 + 正文流式拷贝写入临时文件，再原子替换
+            header = f"---\n{json.dumps(metadata, ensure_ascii=False, indent=2)}\n---\n\n".encode('utf-8')
+            tmp_path = file_path.with_name(file_path.name + ".tmp")
+            with open(file_path, 'rb') as src, open(tmp_path, 'wb') as dst:
+                dst.write(header)
+                src.seek(body_offset)
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+            os.replace(tmp_path, file_path)
+            self._invalidate_meta_cache(file_path)
         except Exception as e:
             print(f"Warning: Could not clean metadata in restored file {file_path}: {e}")
 
     def permanently_delete_trash_item(self, trash_path_str):
         """Permanently delete a single item from the trash."""
         trash_path = Path(trash_path_str)
-        if not trash_path.exists() or self.trash_dir not in trash_path.parents:
+        # 单次lstat同时确认存在性和类型
+        try:
+            trash_mode = os.lstat(trash_path).st_mode
+        except OSError:
+            trash_mode = None
+        if trash_mode is None or self.trash_dir not in trash_path.parents:
             raise FileNotFoundError(f"回收站项目不存在或路径无效: {trash_path}")
         try:
-            if trash_path.is_file():
+            if stat.S_ISREG(trash_mode):
                 trash_path.unlink()
                 print(f"Permanently deleted file: {trash_path}")
-            elif trash_path.is_dir():
+            elif stat.S_ISDIR(trash_mode):
                 shutil.rmtree(trash_path)
                 print(f"Permanently deleted directory: {trash_path}")
             else:  # Symlinks, other types
                 trash_path.unlink()
                 print(f"Permanently deleted item: {trash_path}")
+
+            self._invalidate_meta_cache(trash_path)
+
+            # 同步清理可能存在的恢复信息sidecar
+            sidecar_path = trash_path.with_name(trash_path.name + ".meta.json")
+            if sidecar_path.exists():
+                try:
+                    sidecar_path.unlink()
+                except OSError:
+                    pass
             return True
         except Exception as e:
             raise OSError(f"无法永久删除回收站项目 '{trash_path.name}': {e}")
@@ -1307,11 +1877,72 @@ class NovelManagerGUI:
         self.current_category = None
         self.current_entry_path = None
         self.entry_data_map = {}
+        # 列表文本 -> 行号映射，加载时维护，按文本定位不再整表扫描
+        self._category_index = {}
+        self._entry_index = {}
+        # 重绘合并标记：同一轮事件循环内的多次重绘请求只执行一次
+        self._restyle_scheduled = False
+        # 列表重建合并队列：同一轮事件里登记的脏目标空闲时统一重建一次
+        self._redraw_pending = False
+        self._redraw_targets = set()
+        # 条目列表当前展示的分类；重复选择同一分类时跳过重载
+        self._last_loaded_category = None
+        # 分类 -> (条目数, 标题哈希)，列表内容未变化时load_entries直接短路
+        self._entries_sig = {}
+        # 批量操作后的刷新延迟标记：窗口不可见时先记账，重新映射时再重建列表
+        self._entries_dirty = False
+        self._categories_dirty = False
+        # 搜索结果缓存：同一查询且其间无文件改动时直接复用
+        self._last_search_query = None
+        self._last_search_results = None
+        self._last_search_token = -1
+        self._fs_mutation_token = 0
+        # 分批填充的代数计数（按控件分开）：列表被新内容替换后，旧的补齐回调直接失效
+        self._populate_generations = {}
+        # 条目列表内容的Python侧镜像：处理器按下标取项不再经过Tcl
+        self._all_entry_titles = []
+        # 占位行（"(无条目)"等）的下标集合，选择处理按下标过滤
+        self._placeholder_indices = frozenset()
+        # 条目选择去抖的定时器句柄
+        self._entry_select_after_id = None
+        # 搜索输入防抖的定时器句柄
+        self._search_after_id = None
+        # 字体控件注册表：首次应用字体时分类一次，之后直接遍历
+        self._font_registry = None
+        # 右侧编辑区按需构建：先放占位容器，首次打开条目时才建控件
+        self._right_pane_frame = None
+        self._right_pane_built = False
+        # 编辑器相关变量先建好，未构建控件时clear_editor等也能安全访问
+        self.title_var = tk.StringVar()
+        self.tags_var = tk.StringVar()
+        self.info_label_var = tk.StringVar(value="未加载条目")
+        self.word_count_var = tk.StringVar(value="字数: 0 | 英文: 0 | 符号: 0 | 字符: 0 | 行数: 0")
+        self._editor_is_ctk = bool(HAS_CTK)
+        self._editor_start = "0.0" if HAS_CTK else "1.0"
+        # 共享字体元组：各创建方法复用同一对象，不再逐控件写字面量
+        self._ui_font = ("Microsoft YaHei UI", 15)
+        self._ui_font_small = ("Microsoft YaHei UI", 13)
+        self._ui_font_bold = ("Microsoft YaHei UI", 14, "bold")
+        # 命名字体：控件以名字引用，改动字体对象时由Tk内部原子重排所有绑定控件
+        self._named_fonts = {}
+        for font_name, font_size in (("NovelBody", 15), ("NovelSmall", 13)):
+            try:
+                named = tkFont.Font(root=self.root, name=font_name,
+                                    family="Microsoft YaHei UI", size=font_size)
+            except tk.TclError:
+                # 同名字体已存在（如重复创建窗口），复用并重置参数
+                named = tkFont.nametofont(font_name)
+                named.configure(family="Microsoft YaHei UI", size=font_size)
+            self._named_fonts[font_name] = named
+        # UI构建完成标志：热路径处理器据此跳过逐控件的getattr探测
+        self._widgets_ready = False
         self.is_search_active = False
 
         # --- Initialize Context Menus ---
         self.category_menu = Menu(self.root, tearoff=0)
         self.entry_menu = Menu(self.root, tearoff=0)
+        # 菜单结构只构建一次，右键弹出时仅调整标签和可用状态
+        self._build_context_menus()
 
         # --- UI Creation ---
         self._setup_style()  # Configure ttk styles if needed
@@ -1340,6 +1971,80 @@ class NovelManagerGUI:
         self.root.bind_all("<FocusIn>", self._delayed_style_refresh)
         self.root.bind_all("<ButtonRelease-1>", self._delayed_style_refresh)
 
+        # 列表窗格重新可见时补做被推迟的刷新
+        if hasattr(self, 'entry_listbox'):
+            self.entry_listbox.bind("<Map>", self._on_lists_mapped, add="+")
+
+        # 所有控件已创建完毕，热路径处理器可以直接访问属性
+        self._widgets_ready = True
+
+    def _build_context_menus(self):
+        """一次性搭好右键菜单的固定结构；弹出时用entryconfigure改标签/状态，不再整单重建"""
+        menu = self.category_menu
+        menu.add_command(label="新建分类...", command=self.on_new_category)  # 0
+        menu.add_separator()  # 1
+        menu.add_command(label="重命名...", command=self.on_rename_category)  # 2
+        menu.add_command(label="删除 (回收站)", command=self.on_delete_selected_category)  # 3
+
+        menu = self.entry_menu
+        menu.add_command(label="新建条目", command=self.on_new_entry)  # 0
+        menu.add_separator()  # 1
+        menu.add_command(label="编辑", command=self.on_edit_selected_entry)  # 2
+        menu.add_command(label="重命名...", command=self.on_rename_entry)  # 3
+        menu.add_separator()  # 4
+        menu.add_command(label="删除 (回收站)", command=self.on_delete_selected_entries)  # 5
+        menu.add_command(label="移动到分类...", command=self.on_move_selected_entries)  # 6
+
+    def _request_entries_refresh(self):
+        """批量操作后的条目列表刷新：列表可见时立即重建，否则打脏标记等窗格重新映射"""
+        listbox = getattr(self, 'entry_listbox', None)
+        try:
+            visible = bool(listbox and listbox.winfo_viewable())
+        except tk.TclError:
+            visible = False
+        if visible:
+            self._entries_dirty = False
+            self._schedule_redraw("entries")
+        else:
+            self._entries_dirty = True
+
+    def _request_categories_refresh(self):
+        """批量操作后的分类列表刷新，处理方式同_request_entries_refresh"""
+        listbox = getattr(self, 'category_listbox', None)
+        try:
+            visible = bool(listbox and listbox.winfo_viewable())
+        except tk.TclError:
+            visible = False
+        if visible:
+            self._categories_dirty = False
+            self._schedule_redraw("categories")
+        else:
+            self._categories_dirty = True
+
+    def _on_lists_mapped(self, event=None):
+        """列表窗格重新可见时，补做之前被推迟的刷新"""
+        if self._categories_dirty:
+            self._categories_dirty = False
+            self.load_categories()
+        if self._entries_dirty:
+            self._entries_dirty = False
+            self.load_entries(self.current_category)
+
+    def _report_errors(self, errors, log_full=True):
+        """把错误列表整理成对话框文本：最多显示10条，完整列表进日志"""
+        shown = errors[:10]
+        text = "\n".join(shown)
+        if len(errors) > 10:
+            text += f"\n... 另有 {len(errors) - 10} 条错误，完整列表见日志"
+        if log_full and self.log_manager:
+            for error in errors:
+                self.log_manager.error(error)
+        return text
+
+    def _note_fs_mutation(self):
+        """记录一次文件系统改动，令缓存的搜索结果失效"""
+        self._fs_mutation_token += 1
+
     def _delayed_style_refresh(self, event=None):
         """当焦点或鼠标点击发生变化时延迟刷新样式"""
         self.root.after(50, self._ensure_listbox_styling)
@@ -1364,7 +2069,7 @@ class NovelManagerGUI:
             ctk.set_default_color_theme("blue")
             self._update_root_background()
 
-        elif HAS_SVTTK:
+        elif _svttk_available():
             try:
                 # Try to detect mode for sv-ttk as well
                 import darkdetect
@@ -1411,6 +2116,16 @@ class NovelManagerGUI:
                 "button_green_hover": "#5d8369"  # 稍亮的绿（hover）
             }
         }
+        # 按当前明暗模式解析一次配色，各创建方法直接复用
+        self._refresh_active_colors()
+
+    def _refresh_active_colors(self):
+        """解析当前明暗模式对应的软色调，缓存到_active_colors供创建控件时复用"""
+        if HAS_CTK:
+            mode = "dark" if ctk.get_appearance_mode().lower() == "dark" else "light"
+        else:
+            mode = "dark" if self.current_theme_mode == "dark" else "light"
+        self._active_colors = self.soft_colors[mode]
 
     def _update_root_background(self):
         """Updates the root window background based on the current theme."""
@@ -1420,7 +2135,7 @@ class NovelManagerGUI:
                 bg_color_tuple = ctk.ThemeManager.theme["CTkFrame"]["fg_color"]
                 mode_index = 0 if self.current_theme_mode == 'light' else 1
                 root_bg = bg_color_tuple[mode_index] if isinstance(bg_color_tuple, (list, tuple)) else bg_color_tuple
-            elif HAS_SVTTK:
+            elif _svttk_available():
                 style = ttk.Style()
                 root_bg = style.lookup('.', 'background')  # Get theme background
             # else: use default SystemButtonFace
@@ -1533,6 +2248,27 @@ class NovelManagerGUI:
         self.frame_right = self._create_right_pane(self.right_h_pane)
         self.right_h_pane.add(self.frame_right, weight=3)
 
+        # --- 底部状态栏：批量操作的成功提示走这里，不再弹模态对话框 ---
+        self.status_var = tk.StringVar(value="")
+        self._status_clear_after_id = None
+        if HAS_CTK:
+            self.status_label = ctk.CTkLabel(self.root, textvariable=self.status_var,
+                                             anchor=tk.W, font=self._ui_font_small)
+        else:
+            self.status_label = ttk.Label(self.root, textvariable=self.status_var, anchor=tk.W)
+        self.status_label.pack(side=tk.BOTTOM, fill=tk.X, padx=8, pady=(0, 3))
+
+    def _set_status(self, message, clear_after_ms=5000):
+        """在状态栏显示一条非阻塞提示，若干秒后自动清空"""
+        try:
+            self.status_var.set(message)
+            if self._status_clear_after_id is not None:
+                self.root.after_cancel(self._status_clear_after_id)
+            self._status_clear_after_id = self.root.after(
+                clear_after_ms, lambda: self.status_var.set(""))
+        except tk.TclError:
+            pass
+
     # --- >> Updated _create_menu with self assignments << ---
     def _create_menu(self):
         """Create the application menu bar."""
@@ -1563,7 +2299,7 @@ class NovelManagerGUI:
             self.theme_menu.add_command(label="亮色", command=lambda: self.switch_theme("light"))
             self.theme_menu.add_command(label="暗色", command=lambda: self.switch_theme("dark"))
             self.theme_menu.add_command(label="跟随系统", command=lambda: self.switch_theme("system"))
-        elif HAS_SVTTK:
+        elif _svttk_available():
             self.theme_menu.add_command(label="亮色", command=lambda: self.switch_theme("light"))
             self.theme_menu.add_command(label="暗色", command=lambda: self.switch_theme("dark"))
         else:
@@ -1587,6 +2323,7 @@ class NovelManagerGUI:
         except Exception as e:
             messagebox.showerror("错误", f"加载分类列表时出错: {e}", parent=self.root)
             self.manager.categories = []
+        self.manager._categories_set = set(self.manager.categories)
 
         selected_idx = None
         listbox = getattr(self, 'category_listbox', None)
@@ -1599,12 +2336,12 @@ class NovelManagerGUI:
                 selected_idx = None
 
         if listbox and listbox.winfo_exists():
-            listbox.delete(0, tk.END)
-            for category in self.manager.categories:
-                listbox.insert(tk.END, category)
+            self._category_index = {name: i for i, name in enumerate(self.manager.categories)}
+            # 整表替换：批量插入且插入期间不触发滚动条回调
+            self._set_listbox_items(listbox, self.manager.categories)
 
             restored = False
-            if selected_category and selected_category in self.manager.categories:
+            if selected_category and selected_category in self.manager._categories_set:
                 if self._select_listbox_item_by_text(listbox, selected_category):
                     self.current_category = selected_category  # Keep state consistent
                     restored = True
@@ -1632,15 +2369,8 @@ class NovelManagerGUI:
                     self.current_category = None
                     self.load_entries(None);
                     self.clear_editor()
-            # Ensure theme is applied after loading items
-            self._apply_theme()
-
-        # 加载完成后立即应用颜色
-        self._beautify_listbox(self.category_listbox)
-
-        # 如果已有条目列表，也美化它
-        if hasattr(self, 'entry_listbox') and self.entry_listbox.winfo_exists():
-            self._beautify_listbox(self.entry_listbox)
+        # 主题应用与列表美化合并到空闲回调里执行一次
+        self._schedule_restyle()
 
         return True
 
@@ -1652,33 +2382,60 @@ class NovelManagerGUI:
 
         print(f"加载分类 '{category}' 的条目")
 
-        listbox.delete(0, tk.END)
-        self.entry_data_map.clear()
-        self.is_search_active = False
-
         listbox_state_tk = tk.DISABLED  # For tk.Listbox enabling/disabling visual cues
         list_label_text = "条目列表"
 
-        if category and category in self.manager.categories:
+        entries = None
+        load_error = None
+        if category and category in self.manager._categories_set:
             try:
                 entries = self.manager.list_entries(category)
                 print(f"分类 '{category}' 中找到 {len(entries)} 个条目")
-
-                if entries:
-                    listbox_state_tk = tk.NORMAL
-                    for entry in entries:
-                        listbox.insert(tk.END, entry["title"])
-                        self.entry_data_map[entry["title"]] = entry["path"]
-                        print(f"  添加条目: {entry['title']} -> {entry['path']}")
-                else:
-                    listbox.insert(tk.END, "(无条目)")
-                self.clear_editor()  # Clear editor when category changes
             except Exception as e:
-                messagebox.showerror("错误", f"加载分类 '{category}' 条目出错: {e}", parent=self.root)
-                listbox.insert(tk.END, "(加载错误)")
-                self.clear_editor()
+                load_error = e
+
+        if entries is not None:
+            # 列表签名（条目数 + 标题哈希）与上次一致且列表正展示该分类时，跳过整表重建
+            sig = (len(entries), hash(tuple(entry["title"] for entry in entries)))
+            if (self._last_loaded_category == category
+                    and self._entries_sig.get(category) == sig):
+                return
+            self._entries_sig[category] = sig
         else:
-            listbox.insert(tk.END, "(请先选择分类)")
+            self._entries_sig.pop(category, None)
+
+        self.entry_data_map.clear()
+        self._entry_index = {}
+        self._all_entry_titles = []
+        self.is_search_active = False
+
+        if entries is not None:
+            if entries:
+                listbox_state_tk = tk.NORMAL
+                # 批量插入并整体更新映射，省去逐项Tcl调用和print；超大列表分批填充
+                titles = [entry["title"] for entry in entries]
+                self._set_listbox_items(listbox, titles)
+                # intern标题/路径串：同一字符串在映射、索引和列表间共享一份
+                self.entry_data_map.update(
+                    (sys.intern(entry["title"]), sys.intern(entry["path"])) for entry in entries)
+                self._entry_index = {title: i for i, title in enumerate(titles)}
+                self._all_entry_titles = titles
+                self._placeholder_indices = frozenset()
+            else:
+                self._set_listbox_items(listbox, ["(无条目)"])
+                self._all_entry_titles = ["(无条目)"]
+                self._placeholder_indices = frozenset((0,))
+            self.clear_editor()  # Clear editor when category changes
+        elif load_error is not None:
+            messagebox.showerror("错误", f"加载分类 '{category}' 条目出错: {load_error}", parent=self.root)
+            self._set_listbox_items(listbox, ["(加载错误)"])
+            self._all_entry_titles = ["(加载错误)"]
+            self._placeholder_indices = frozenset((0,))
+            self.clear_editor()
+        else:
+            self._set_listbox_items(listbox, ["(请先选择分类)"])
+            self._all_entry_titles = ["(请先选择分类)"]
+            self._placeholder_indices = frozenset((0,))
             self.clear_editor()
 
         # Update label and Listbox state/appearance
@@ -1691,11 +2448,11 @@ class NovelManagerGUI:
         if not HAS_CTK:  # Only configure state for non-CTk listbox
             listbox.config(state=listbox_state_tk)
 
-        # Re-apply theme to ensure listbox colors are correct after update
-        self._apply_theme()
+        # 记录列表当前展示的分类，供选择事件判断是否需要重载
+        self._last_loaded_category = category
 
-        # 在方法末尾添加，确保列表项加载后应用颜色
-        self._beautify_listbox(self.entry_listbox)
+        # 主题应用与列表美化合并到空闲回调里执行一次
+        self._schedule_restyle()
 
     def load_search_results(self, results):
         """Load search results into the entry listbox."""
@@ -1703,8 +2460,10 @@ class NovelManagerGUI:
         list_label = getattr(self, 'entry_list_label', None)
         if not listbox or not listbox.winfo_exists(): return
 
-        listbox.delete(0, tk.END)
         self.entry_data_map.clear()
+        self._entry_index = {}
+        self._all_entry_titles = []
+        self._last_loaded_category = None  # 列表改为展示搜索结果
         self.is_search_active = True
 
         listbox_state_tk = tk.DISABLED
@@ -1712,12 +2471,18 @@ class NovelManagerGUI:
 
         if results:
             listbox_state_tk = tk.NORMAL
-            for result in results:
-                display_text = f"[{result['category']}] {result['title']}"
-                listbox.insert(tk.END, display_text)
-                self.entry_data_map[display_text] = result['path']
+            # 先构造全部显示文本，再一次性插入并整体更新映射
+            display_texts = [f"[{result['category']}] {result['title']}" for result in results]
+            self._set_listbox_items(listbox, display_texts)
+            self.entry_data_map.update(
+                zip(map(sys.intern, display_texts), (sys.intern(result['path']) for result in results)))
+            self._entry_index = {text: i for i, text in enumerate(display_texts)}
+            self._all_entry_titles = display_texts
+            self._placeholder_indices = frozenset()
         else:
-            listbox.insert(tk.END, "无匹配结果")
+            self._set_listbox_items(listbox, ["无匹配结果"])
+            self._all_entry_titles = ["无匹配结果"]
+            self._placeholder_indices = frozenset((0,))
 
         self.clear_editor()  # Clear editor when showing results
 
@@ -1730,7 +2495,7 @@ class NovelManagerGUI:
         if not HAS_CTK:
             listbox.config(state=listbox_state_tk)
 
-        self._apply_theme()
+        self._schedule_restyle()
 
     def clear_editor(self, keep_selection=False):
         """Clear editor fields and reset state."""
@@ -1740,7 +2505,7 @@ class NovelManagerGUI:
         content_widget = getattr(self, 'content_text', None)
         if content_widget and content_widget.winfo_exists():
             # Use appropriate method for CTkTextbox or tk.Text
-            start_index = "0.0" if isinstance(content_widget, ctk.CTkTextbox) else 1.0
+            start_index = self._editor_start
             end_index = tk.END
             try:
                 content_widget.delete(start_index, end_index)
@@ -1748,7 +2513,7 @@ class NovelManagerGUI:
                 print(f"Debug: Error clearing content widget: {e}")
 
             # Reset undo stack (only for tk.Text)
-            if isinstance(content_widget, tk.Text):
+            if not self._editor_is_ctk:
                 try:
                     content_widget.edit_reset()
                 except tk.TclError:
@@ -1768,36 +2533,173 @@ class NovelManagerGUI:
                 except tk.TclError:
                     pass
 
-    def _update_info_label(self, metadata):
-        """Update info label with formatted dates."""
-        created = metadata.get("created_at", "N/A")
-        updated = metadata.get("updated_at", "N/A")
-        created_str, updated_str = created, updated
+    def _set_editor_content(self, content):
+        """把编辑器内容替换为content；内容未变化时直接返回，避免无谓的删除/插入"""
+        if not self._widgets_ready or not self._right_pane_built:
+            return
+        editor = self.content_text
+        start_index = self._editor_start
         try:
-            if isinstance(created, str) and len(created) > 18:
-                if created.endswith('Z'): created = created[:-1] + '+00:00'
-                # Handle potential fractional seconds before parsing
-                created_dt = datetime.datetime.fromisoformat(created.split('.')[0])
-                created_str = created_dt.strftime("%Y-%m-%d %H:%M")
-            if isinstance(updated, str) and len(updated) > 18:
-                if updated.endswith('Z'): updated = updated[:-1] + '+00:00'
-                updated_dt = datetime.datetime.fromisoformat(updated.split('.')[0])
-                updated_str = updated_dt.strftime("%Y-%m-%d %H:%M")
+            if editor.get(start_index, "end-1c") == content:
+                return
+            editor.delete(start_index, tk.END)
+            if content:
+                editor.insert(start_index, content)
+            # Reset undo stack (only for tk.Text)
+            if not self._editor_is_ctk:
+                try:
+                    editor.edit_reset()
+                except tk.TclError:
+                    pass
+        except tk.TclError as e:
+            print(f"Debug: Error setting editor content: {e}")
+
+    @staticmethod
+    def _fmt_iso(value):
+        """ISO时间串到 'YYYY-MM-DD HH:MM' 的快速切片格式化。
+
+        本应用写入的时间戳都是标准ISO格式，直接按固定位置切片即可；
+        形状不符时才退回datetime解析。
+        """
+        if not isinstance(value, str) or len(value) < 16:
+            return value
+        # 形状检查：YYYY-MM-DDTHH:MM...（分隔符允许T或空格）
+        if (value[4] == '-' and value[7] == '-' and value[10] in ('T', ' ')
+                and value[13] == ':'):
+            return value[0:10] + ' ' + value[11:16]
+        try:
+            parsed = value[:-1] + '+00:00' if value.endswith('Z') else value
+            return datetime.datetime.fromisoformat(parsed.split('.')[0]).strftime("%Y-%m-%d %H:%M")
         except ValueError:
-            # Handle cases where fromisoformat fails on the string
-            print(f"Debug: Could not parse date: created='{created}', updated='{updated}'")
+            print(f"Debug: Could not parse date: '{value}'")
         except Exception as e:
             print(f"Debug: Error parsing date for info label: {e}")
+        return value
 
+    def _update_info_label(self, metadata):
+        """Update info label with formatted dates."""
+        created_str = self._fmt_iso(metadata.get("created_at", "N/A"))
+        updated_str = self._fmt_iso(metadata.get("updated_at", "N/A"))
         self.info_label_var.set(f"创建: {created_str} | 更新: {updated_str}")
 
+    # 超过该数量的列表分批填充，首批之外的行在空闲回调中补齐
+    _LISTBOX_CHUNK_THRESHOLD = 500
+    _LISTBOX_CHUNK_SIZE = 200
+
+    def _populate_listbox_chunked(self, listbox, items):
+        """向listbox填充items；大列表只同步插入首批，剩余分批延后。
+
+        保持tk.Listbox原有API不变，调用方（选择/右键处理器）无需感知。
+        """
+        generation = self._populate_generations.get(listbox, 0) + 1
+        self._populate_generations[listbox] = generation
+        if len(items) <= self._LISTBOX_CHUNK_THRESHOLD:
+            if items:
+                listbox.insert(tk.END, *items)
+            return
+
+        chunk_size = self._LISTBOX_CHUNK_SIZE
+        listbox.insert(tk.END, *items[:chunk_size])
+
+        def insert_rest(start):
+            # 列表已被新内容替换或控件销毁时放弃补齐
+            if generation != self._populate_generations.get(listbox):
+                return
+            chunk = items[start:start + chunk_size]
+            if not chunk:
+                return
+            try:
+                if not listbox.winfo_exists():
+                    return
+                listbox.insert(tk.END, *chunk)
+            except tk.TclError:
+                return
+            self.root.after_idle(lambda: insert_rest(start + chunk_size))
+
+        self.root.after_idle(lambda: insert_rest(chunk_size))
+
+    def _schedule_redraw(self, target):
+        """登记一个待重建的列表（"categories"/"entries"），空闲回调里统一执行一次"""
+        self._redraw_targets.add(target)
+        if self._redraw_pending:
+            return
+        self._redraw_pending = True
+        try:
+            self.root.after_idle(self._flush_redraw)
+        except tk.TclError:
+            self._redraw_pending = False
+
+    def _flush_redraw(self):
+        """执行累计的列表重建；先分类后条目，重复登记只做一遍"""
+        self._redraw_pending = False
+        targets, self._redraw_targets = self._redraw_targets, set()
+        if "categories" in targets:
+            self.load_categories()
+        if "entries" in targets:
+            self.load_entries(self.current_category)
+
+    def _set_listbox_items(self, listbox, items):
+        """整表替换listbox内容；主批量插入期间暂停滚动条回调，避免逐次重算"""
+        scrollcmd = None
+        try:
+            scrollcmd = listbox.cget("yscrollcommand")
+            if scrollcmd:
+                listbox.configure(yscrollcommand="")
+        except tk.TclError:
+            scrollcmd = None
+        try:
+            listbox.delete(0, tk.END)
+            self._populate_listbox_chunked(listbox, items)
+        finally:
+            if scrollcmd:
+                try:
+                    listbox.configure(yscrollcommand=scrollcmd)
+                    listbox.yview_moveto(0.0)  # 恢复后同步一次滚动条
+                except tk.TclError:
+                    pass
+
+    def _schedule_restyle(self):
+        """请求一次主题/列表重绘；同一轮事件循环内的重复请求会被合并"""
+        if self._restyle_scheduled:
+            return
+        self._restyle_scheduled = True
+        try:
+            self.root.after_idle(self._do_restyle)
+        except tk.TclError:
+            self._restyle_scheduled = False
+
+    def _do_restyle(self):
+        """实际执行主题应用和列表美化（由after_idle触发一次）"""
+        self._restyle_scheduled = False
+        try:
+            self._apply_theme()
+            for attr in ('category_listbox', 'entry_listbox'):
+                listbox = getattr(self, attr, None)
+                if listbox and listbox.winfo_exists():
+                    self._beautify_listbox(listbox)
+        except tk.TclError:
+            pass
+
     def _select_listbox_item_by_text(self, listbox, text_to_find, select=True):
         """Find and optionally select a listbox item by exact text."""
         if not listbox or not listbox.winfo_exists(): return False
         listbox.update_idletasks()  # Ensure list is updated
         try:
-            items = listbox.get(0, tk.END)
-            idx = items.index(text_to_find)
+            # 优先查加载时维护的文本->行号映射，未命中或失效时退回整表扫描
+            idx = None
+            verified = False
+            if listbox is getattr(self, 'category_listbox', None):
+                idx = self._category_index.get(text_to_find)
+            elif listbox is getattr(self, 'entry_listbox', None):
+                idx = self._entry_index.get(text_to_find)
+                # 条目列表有Python侧镜像，核对命中无需Tcl调用
+                verified = (idx is not None
+                            and idx < len(self._all_entry_titles)
+                            and self._all_entry_titles[idx] == text_to_find)
+            if not verified and (
+                    idx is None or idx >= listbox.size() or listbox.get(idx) != text_to_find):
+                items = listbox.get(0, tk.END)
+                idx = items.index(text_to_find)
             if select:
                 listbox.selection_clear(0, tk.END)
                 listbox.selection_set(idx)
@@ -1813,8 +2715,9 @@ class NovelManagerGUI:
     # (on_category_select, on_entry_select, on_new_category, on_rename_category, on_delete_selected_category, on_new_entry, on_edit_selected_entry, on_save, on_delete_selected_entries, on_move_selected_entries, on_rename_entry, on_search, on_clear_search, on_view_trash, on_empty_trash - unchanged)
     def on_category_select(self, event=None):
         """Handle category selection."""
-        listbox = event.widget if event and hasattr(event, 'widget') else getattr(self, 'category_listbox', None)
-        if not listbox or not listbox.winfo_exists(): return
+        if not self._widgets_ready:
+            return
+        listbox = event.widget if event and hasattr(event, 'widget') else self.category_listbox
 
         try:
             selection = listbox.curselection()
@@ -1826,8 +2729,11 @@ class NovelManagerGUI:
                 old_category = self.current_category
                 self.current_category = selected
 
-                if old_category != self.current_category:
-                    self.load_entries(self.current_category)
+                # 条目列表已经展示该分类时无需重载（搜索结果态除外）
+                # 重载合并到空闲回调：快速连续切换分类只重建最终停留的那个
+                if (old_category != self.current_category
+                        or self._last_loaded_category != self.current_category):
+                    self._schedule_redraw("entries")
             else:
                 # If selection is cleared, keep last category
                 pass
@@ -1837,38 +2743,76 @@ class NovelManagerGUI:
         # 确保在选择后重新应用深色样式
         self.root.after(10, lambda: self._beautify_listbox(listbox))
 
+    def _on_entry_select_debounced(self, event=None):
+        """条目选择事件去抖：键盘连续移动时只加载最终停留的条目"""
+        if self._entry_select_after_id is not None:
+            try:
+                self.root.after_cancel(self._entry_select_after_id)
+            except tk.TclError:
+                pass
+            self._entry_select_after_id = None
+        try:
+            self._entry_select_after_id = self.root.after(120, self._fire_entry_select)
+        except tk.TclError:
+            self.on_entry_select(None)
+
+    def _fire_entry_select(self):
+        """去抖计时到期，执行真正的选择处理"""
+        self._entry_select_after_id = None
+        self.on_entry_select(None)
+
+    def _debounced_search(self, event=None):
+        """输入防抖：连续击键只在停顿约120ms后触发一次搜索"""
+        if event is not None and event.keysym in ("Return", "Escape", "Tab"):
+            return  # 这些键已有各自的绑定，避免重复触发
+        if self._search_after_id is not None:
+            try:
+                self.root.after_cancel(self._search_after_id)
+            except tk.TclError:
+                pass
+            self._search_after_id = None
+        try:
+            self._search_after_id = self.root.after(120, self._fire_search)
+        except tk.TclError:
+            pass
+
+    def _fire_search(self):
+        """防抖计时到期，执行真正的搜索"""
+        self._search_after_id = None
+        self.on_search()
+
     def on_entry_select(self, event=None):
         """Handle entry selection."""
-        # 获取列表控件，适应不同来源的调用
-        listbox = None
-        if event and hasattr(event, 'widget'):
-            # 从事件获取列表控件
-            listbox = event.widget
-        else:
-            # 直接使用类属性中的列表控件
-            listbox = getattr(self, 'entry_listbox', None)
-
-        if not listbox or not listbox.winfo_exists():
+        if not self._widgets_ready:
             return
+        # 获取列表控件，适应不同来源的调用
+        listbox = event.widget if event and hasattr(event, 'widget') else self.entry_listbox
 
         try:
             # 获取选择
             selection = listbox.curselection()
             if selection:
                 index = int(selection[0])
-                selected = listbox.get(index)
-
-                # 跳过占位符项
-                if selected.startswith("(") and selected.endswith(")"):
+                # 跳过占位符项（下标在加载时已记录）
+                if index in self._placeholder_indices:
                     return
 
+                # 首次打开条目时才真正构建右侧编辑区
+                self._ensure_right_pane_built()
+
+                # 优先走Python侧镜像取项
+                if index < len(self._all_entry_titles):
+                    selected = self._all_entry_titles[index]
+                else:
+                    selected = listbox.get(index)
+
                 # 从条目映射获取路径
                 path = self.entry_data_map.get(selected)
 
                 # 检查路径是否有效
                 if path and os.path.exists(path):
                     # 使用绝对路径，确保路径比较的一致性
-                    self.current_entry_path = str(Path(path).resolve())
+                    self.current_entry_path = str(_cached_path(path).resolve())
                     try:
                         # 打印选中的条目路径（调试用）
                         print(f"Entry selected: {self.current_entry_path}")
@@ -1876,14 +2820,8 @@ class NovelManagerGUI:
                         # 获取条目数据
                         entry_data = self.manager.get_entry_by_path(self.current_entry_path)
                         if entry_data:
-                            # 更新编辑器
-                            editor = getattr(self, 'content_text', None)
-                            if editor:
-                                self.clear_editor(keep_selection=True)
-                                if isinstance(editor, ctk.CTkTextbox):
-                                    editor.insert("1.0", entry_data.get("content", ""))
-                                else:
-                                    editor.insert(tk.END, entry_data.get("content", ""))
+                            # 更新编辑器：内容相同（如重复点选）时不重建文本
+                            self._set_editor_content(entry_data.get("content", ""))
 
                             # 更新标签和标题
                             title_var = getattr(self, 'title_var', None)
@@ -1935,6 +2873,7 @@ class NovelManagerGUI:
                 clean_name = new_category.strip()
                 added = self.manager.add_category(clean_name)
                 if added:
+                    self._note_fs_mutation()
                     print(f"Category '{clean_name}' added.")
                     self.load_categories()
                     self._select_listbox_item_by_text(self.category_listbox, clean_name)
@@ -1975,6 +2914,7 @@ class NovelManagerGUI:
             try:
                 renamed = self.manager.rename_category(current_name, clean_new_name)
                 if renamed:
+                    self._note_fs_mutation()
                     print(f"Category '{current_name}' renamed to '{clean_new_name}'.")
                     path_before = self.current_entry_path
                     # Update state var if renamed category was selected
@@ -1985,10 +2925,11 @@ class NovelManagerGUI:
 
                     # Update editor path if the open entry was in the renamed category
                     if path_before:
-                        old_path = Path(path_before)
-                        # Ensure parent exists before checking name
-                        if old_path.parent and old_path.parent.exists() and old_path.parent.name == current_name:
-                            self.current_entry_path = str(self.manager.root_dir / clean_new_name / old_path.name)
+                        # 纯字符串操作判断父目录名，省去Path构造和多次stat
+                        old_parent = os.path.dirname(path_before)
+                        if old_parent and os.path.basename(old_parent) == current_name:
+                            self.current_entry_path = str(
+                                self.manager.root_dir / clean_new_name / os.path.basename(path_before))
                             print(f"Updated current entry path: {self.current_entry_path}")
             except (ValueError, OSError, FileExistsError) as e:
                 messagebox.showerror("重命名错误", f"无法重命名分类:\n{str(e)}", parent=self.root)
@@ -2016,6 +2957,7 @@ class NovelManagerGUI:
                 was_selected = (self.current_category == selected_category)
                 removed = self.manager.remove_category(selected_category)
                 if removed:
+                    self._note_fs_mutation()
                     messagebox.showinfo("成功", f"分类 '{selected_category}' 已移到回收站。", parent=self.root)
                     # If the deleted category was selected, clear editor state as well
                     if was_selected:
@@ -2032,6 +2974,7 @@ class NovelManagerGUI:
             messagebox.showwarning("选择分类", "请先选择一个分类以创建新条目。", parent=self.root)
             return
 
+        self._ensure_right_pane_built()
         self.clear_editor(keep_selection=False)  # Clear editor & deselect list
         self.title_var.set("新条目")
         self.info_label_var.set(f"新条目 (将在 '{self.current_category}' 中创建)")
@@ -2087,10 +3030,10 @@ class NovelManagerGUI:
             return False
 
         # Get titles of selected entries
-        selected_titles = [self.entry_listbox.get(i) for i in selected_indices]
-        
-        # Skip non-entries from UI placeholder text
-        valid_titles = [title for title in selected_titles if title not in ["(无条目)", "(请先选择分类)", "(加载错误)", "无匹配结果"]]
+        # 按下标取项直接走Python侧镜像，占位行按已记录的下标过滤
+        all_items = self._all_entry_titles
+        valid_titles = [all_items[i] for i in selected_indices
+                        if i not in self._placeholder_indices]
         if not valid_titles:
             messagebox.showinfo("提示", "没有可删除的有效条目", parent=self.root)
             return False
@@ -2104,6 +3047,8 @@ class NovelManagerGUI:
         success_count = 0
         error_messages = []
 
+        # 先在主线程解析出 (标题, 路径) 任务列表
+        tasks = []
         for title in valid_titles:
             # Handle search results (format: "[Category] Title")
             if self.is_search_active and "[" in title and "]" in title:
@@ -2116,46 +3061,55 @@ class NovelManagerGUI:
             if not file_path:
                 error_messages.append(f"找不到条目 '{title}' 的文件路径")
                 continue
+            tasks.append((title, file_path))
 
+        def _delete_one(title, file_path):
             try:
-                # Delete the entry
                 if self.manager.delete_entry(file_path):
-                    success_count += 1
-                    
-                    # 记录日志
-                    if self.log_manager:
-                        self.log_manager.info(f"已删除条目: {title}")
-                else:
-                    error_messages.append(f"删除条目 '{title}' 失败")
-                    
-                    # 记录日志
-                    if self.log_manager:
-                        self.log_manager.error(f"删除条目失败: {title}")
+                    return title, None
+                return title, f"删除条目 '{title}' 失败"
             except Exception as e:
-                error_messages.append(f"删除条目 '{title}' 出错: {e}")
-                
-                # 记录日志
+                return title, f"删除条目 '{title}' 出错: {e}"
+
+        # 多个文件时用线程池并行移入回收站：开销主要在文件系统元数据操作上
+        if len(tasks) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(tasks))) as pool:
+                results = list(pool.map(lambda task: _delete_one(*task), tasks))
+        else:
+            results = [_delete_one(*task) for task in tasks]
+
+        # 日志和错误汇总回到主线程统一处理
+        for title, error in results:
+            if error is None:
+                success_count += 1
+                if self.log_manager:
+                    self.log_manager.info(f"已删除条目: {title}")
+            else:
+                error_messages.append(error)
                 if self.log_manager:
-                    self.log_manager.error(f"删除条目出错: {title} - {e}")
+                    self.log_manager.error(error)
 
-        # Reload entries
-        self.load_entries(self.current_category)
+        if success_count > 0:
+            self._note_fs_mutation()
+
+        # Reload entries (deferred if the pane is not currently visible)
+        self._request_entries_refresh()
 
         # Clear editor if current entry was deleted
         if self.current_entry_path and any(self.current_entry_path == self.entry_data_map.get(title) for title in valid_titles):
             self.clear_editor()
 
-        # Show result message
+        # Show result message（逐条错误已在上面写入日志，弹窗只显示前若干条）
         if success_count > 0:
             if error_messages:
                 messagebox.showwarning("部分删除成功", 
-                                     f"成功删除了 {success_count}/{len(valid_titles)} 个条目。\n\n错误信息:\n" + "\n".join(error_messages),
+                                     f"成功删除了 {success_count}/{len(valid_titles)} 个条目。\n\n错误信息:\n" + self._report_errors(error_messages, log_full=False),
                                      parent=self.root)
             else:
-                messagebox.showinfo("删除成功", f"成功删除了 {success_count} 个条目", parent=self.root)
+                self._set_status(f"已删除 {success_count} 个条目")
             return True
         else:
-            messagebox.showerror("删除失败", "没有条目被删除。\n\n错误信息:\n" + "\n".join(error_messages), parent=self.root)
+            messagebox.showerror("删除失败", "没有条目被删除。\n\n错误信息:\n" + self._report_errors(error_messages, log_full=False), parent=self.root)
             return False
 
     def on_move_selected_entries(self):
@@ -2170,8 +3124,10 @@ class NovelManagerGUI:
             return False
 
         # Get titles of selected entries
-        selected_titles = [self.entry_listbox.get(i) for i in selected_indices]
-        valid_titles = [title for title in selected_titles if title not in ["(无条目)", "(请先选择分类)", "(加载错误)", "无匹配结果"]]
+        # 按下标取项直接走Python侧镜像，占位行按已记录的下标过滤
+        all_items = self._all_entry_titles
+        valid_titles = [all_items[i] for i in selected_indices
+                        if i not in self._placeholder_indices]
         if not valid_titles:
             messagebox.showinfo("提示", "没有可移动的有效条目", parent=self.root)
             return False
@@ -2183,7 +3139,7 @@ class NovelManagerGUI:
 
         # Get the source category
         current_category = self.current_category
-        if not current_category or current_category not in self.manager.categories:
+        if not current_category or current_category not in self.manager._categories_set:
             messagebox.showerror("错误", "当前分类无效，无法移动条目", parent=self.root)
             return False
 
@@ -2199,7 +3155,7 @@ class NovelManagerGUI:
             return False  # User cancelled
 
         target_category = dialog.result["category"]
-        if not target_category or target_category not in self.manager.categories:
+        if not target_category or target_category not in self.manager._categories_set:
             messagebox.showerror("错误", f"目标分类 '{target_category}' 无效", parent=self.root)
             return False
 
@@ -2207,52 +3163,62 @@ class NovelManagerGUI:
         success_count = 0
         error_messages = []
 
+        # 先在主线程解析出 (标题, 路径) 任务列表
+        tasks = []
         for title in valid_titles:
-            try:
-                # Get source file path
-                source_path = self.entry_data_map.get(title)
-                if not source_path:
-                    error_messages.append(f"找不到条目 '{title}' 的文件路径")
-                    continue
+            source_path = self.entry_data_map.get(title)
+            if not source_path:
+                error_messages.append(f"找不到条目 '{title}' 的文件路径")
+                continue
+            tasks.append((title, source_path))
 
-                # Move the entry
+        def _move_one(title, source_path):
+            try:
                 if self.manager.move_entry(source_path, target_category):
-                    success_count += 1
-                    
-                    # 记录日志
-                    if self.log_manager:
-                        self.log_manager.info(f"已移动条目: {title} 从 {current_category} 到 {target_category}")
-                else:
-                    error_messages.append(f"移动条目 '{title}' 失败")
-                    
-                    # 记录日志
-                    if self.log_manager:
-                        self.log_manager.error(f"移动条目失败: {title}")
+                    return title, None
+                return title, f"移动条目 '{title}' 失败"
             except Exception as e:
-                error_messages.append(f"移动条目 '{title}' 出错: {e}")
-                
-                # 记录日志
+                return title, f"移动条目 '{title}' 出错: {e}"
+
+        # 多个文件时用线程池并行移动；manager内部对分类注册加锁
+        if len(tasks) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(tasks))) as pool:
+                results = list(pool.map(lambda task: _move_one(*task), tasks))
+        else:
+            results = [_move_one(*task) for task in tasks]
+
+        # 日志和错误汇总回到主线程统一处理
+        for title, error in results:
+            if error is None:
+                success_count += 1
                 if self.log_manager:
-                    self.log_manager.error(f"移动条目出错: {title} - {e}")
+                    self.log_manager.info(f"已移动条目: {title} 从 {current_category} 到 {target_category}")
+            else:
+                error_messages.append(error)
+                if self.log_manager:
+                    self.log_manager.error(error)
+
+        if success_count > 0:
+            self._note_fs_mutation()
 
-        # Reload entries for current category
-        self.load_entries(self.current_category)
+        # Reload entries for current category (deferred if the pane is not visible)
+        self._request_entries_refresh()
 
         # Clear editor if current entry was moved
         if self.current_entry_path and any(self.current_entry_path == self.entry_data_map.get(title) for title in valid_titles):
             self.clear_editor()
 
-        # Show result message
+        # Show result message（逐条错误已在上面写入日志，弹窗只显示前若干条）
         if success_count > 0:
             if error_messages:
                 messagebox.showwarning("部分移动成功", 
-                                     f"成功移动了 {success_count}/{len(valid_titles)} 个条目到 '{target_category}'。\n\n错误信息:\n" + "\n".join(error_messages),
+                                     f"成功移动了 {success_count}/{len(valid_titles)} 个条目到 '{target_category}'。\n\n错误信息:\n" + self._report_errors(error_messages, log_full=False),
                                      parent=self.root)
             else:
-                messagebox.showinfo("移动成功", f"成功移动了 {success_count} 个条目到 '{target_category}'", parent=self.root)
+                self._set_status(f"已移动 {success_count} 个条目到 '{target_category}'")
             return True
         else:
-            messagebox.showerror("移动失败", f"没有条目被移动到 '{target_category}'。\n\n错误信息:\n" + "\n".join(error_messages), parent=self.root)
+            messagebox.showerror("移动失败", f"没有条目被移动到 '{target_category}'。\n\n错误信息:\n" + self._report_errors(error_messages, log_full=False), parent=self.root)
             return False
 
     def on_rename_entry(self):
@@ -2264,25 +3230,22 @@ class NovelManagerGUI:
 
         try:
             index = listbox.curselection()[0]
-            current_display_text = listbox.get(index)
-            if current_display_text.startswith("("):
+            if index in self._placeholder_indices:
                 messagebox.showwarning("无效操作", "不能重命名占位符项目。", parent=self.root)
                 return
+            current_display_text = (self._all_entry_titles[index]
+                                    if index < len(self._all_entry_titles) else listbox.get(index))
         except (tk.TclError, IndexError):
             messagebox.showerror("错误", "无法获取选中的条目。", parent=self.root)
             return
 
+        # entry_data_map由加载流程维护，路径有效性交给后续读取/保存去报告，
+        # 这里不再额外stat一次文件
         entry_path_str = self.entry_data_map.get(current_display_text)
-        path_valid = False
-        if entry_path_str:
-            try:
-                path_valid = Path(entry_path_str).is_file()
-            except Exception:
-                pass
-        if not path_valid: messagebox.showerror("错误", "无法找到条目文件。", parent=self.root); return
+        if not entry_path_str: messagebox.showerror("错误", "无法找到条目文件。", parent=self.root); return
 
         # Get metadata title for dialog prefill
-        current_metadata_title = Path(entry_path_str).stem
+        current_metadata_title = os.path.splitext(os.path.basename(entry_path_str))[0]
         try:
             entry_data = self.manager.get_entry_by_path(entry_path_str, read_content=False)
             if entry_data and entry_data.get("metadata", {}).get("title"):
@@ -2308,22 +3271,21 @@ class NovelManagerGUI:
                 if not entry_data: raise ValueError("无法读取原始条目数据。")
                 content = entry_data.get('content', '')
                 tags = entry_data.get('metadata', {}).get('tags', [])
-                entry_category = Path(entry_path_str).parent.name
+                entry_category = os.path.basename(os.path.dirname(entry_path_str))
 
                 saved_path_str = self.manager.save_entry(entry_category, new_title, content, tags,
                                                          existing_path_str=entry_path_str)
+                self._note_fs_mutation()
                 print(f"Rename via save successful: {saved_path_str}")
 
                 # Update UI
                 if self.current_entry_path == entry_path_str:
                     self.current_entry_path = saved_path_str
                     self.title_var.set(new_title)
-                    try:  # Update info label
-                        updated_data = self.manager.get_entry_by_path(saved_path_str, read_content=False)
-                        if updated_data and updated_data.get("metadata"): self._update_info_label(
-                            updated_data["metadata"])
-                    except Exception:
-                        pass
+                    # save_entry刚写入的元数据还在内存里，直接拿来更新信息栏
+                    saved_meta = self.manager.last_saved_metadata
+                    if saved_meta:
+                        self._update_info_label(saved_meta)
 
                 # Refresh list/search
                 if self.is_search_active:
@@ -2346,9 +3308,18 @@ class NovelManagerGUI:
         """Perform search and display results."""
         query = self.search_var.get().strip()
         if not query: self.on_clear_search(); return
+        # 同一查询且其间没有文件改动时，直接复用上次的结果
+        if (query == self._last_search_query
+                and self._last_search_token == self._fs_mutation_token
+                and self._last_search_results is not None):
+            self.load_search_results(self._last_search_results)
+            return
         print(f"Searching for: '{query}'")
         try:
             results = self.manager.search(query)  # Search all categories
+            self._last_search_query = query
+            self._last_search_results = results
+            self._last_search_token = self._fs_mutation_token
             self.load_search_results(results)
         except Exception as e:
             messagebox.showerror("搜索错误", f"搜索时发生错误:\n{e}", parent=self.root)
@@ -2357,6 +3328,7 @@ class NovelManagerGUI:
         """Clear search results and show current category."""
         if not self.is_search_active and not self.search_var.get(): return
         print("Clearing search.")
+        was_search_active = self.is_search_active
         self.search_var.set("")
         self.is_search_active = False
         # Remove focus from search entry
@@ -2368,7 +3340,13 @@ class NovelManagerGUI:
                 list_label.configure(text="条目列表")
             except:
                 list_label.config(text="条目列表")
-        self.load_entries(self.current_category)  # Clears editor too
+        # 列表已经展示当前分类且没有待补刷新时，无需重载；
+        # 之前在展示搜索结果时必须重载（未选分类时两边都是None，单比较分类会误判）
+        if (was_search_active
+                or self._last_loaded_category != self.current_category
+                or self._entries_dirty):
+            self._entries_dirty = False
+            self._schedule_redraw("entries")  # Clears editor too
 
     # --- Trash Handlers ---
     def on_view_trash(self):
@@ -2392,23 +3370,25 @@ class NovelManagerGUI:
         restored_paths = []  # 记录恢复的路径
 
         print(f"Trash action: {action} on {len(items_to_process)} items.")
+        # 根目录字符串只算一次，循环里用前缀比较替代parents序列的逐级构造
+        root_str = self.manager._root_str
+        root_prefix = root_str + os.sep
         for item_path in items_to_process:
             try:
                 result = None
                 if action == "restore":
                     result = self.manager.restore_trash_item(str(item_path))
                     if result:
-                        restored_path = Path(result)
-                        restored_paths.append(restored_path)
+                        restored_paths.append(result)
                         # Determine affected category/root
-                        parent_dir = restored_path.parent
-                        if parent_dir == self.manager.root_dir:
-                            if restored_path.is_dir():  # Restored category to root
-                                affected_categories.add(restored_path.name)
+                        parent_dir = os.path.dirname(result)
+                        if parent_dir == root_str:
+                            if os.path.isdir(result):  # Restored category to root
+                                affected_categories.add(os.path.basename(result))
                             else:  # 文件恢复到根目录
                                 affected_categories.add("ROOT")  # 标记根目录受影响
-                        elif self.manager.root_dir in parent_dir.parents:  # Restored to a sub-category
-                            affected_categories.add(parent_dir.name)
+                        elif parent_dir.startswith(root_prefix):  # Restored to a sub-category
+                            affected_categories.add(os.path.basename(parent_dir))
 
                 elif action == "delete":
                     result = self.manager.permanently_delete_trash_item(str(item_path))
@@ -2419,27 +3399,30 @@ class NovelManagerGUI:
                 errors.append(f"{action_verb} '{item_path.name}': {e}")
                 print(f"Error during {action}: {e}")
 
-        # 显示结果信息
+        # 显示结果信息（完整错误列表写入日志）
         if errors:
             messagebox.showerror(f"{action_verb}错误",
-                                 f"{action_verb}时出错 ({len(errors)}/{len(items_to_process)}项失败):\n" + "\n".join(
-                                     errors[:5]),
+                                 f"{action_verb}时出错 ({len(errors)}/{len(items_to_process)}项失败):\n"
+                                 + self._report_errors(errors),
                                  parent=self.root)
         elif processed_count > 0:
-            messagebox.showinfo("成功", f"已{action_verb} {processed_count} 个项目。", parent=self.root)
+            self._set_status(f"已{action_verb} {processed_count} 个项目")
+
+        if processed_count > 0:
+            self._note_fs_mutation()
 
         # 更新 UI 以显示恢复的项目
         if action == "restore" and processed_count > 0:
             print(f"Restored paths: {restored_paths}")
             print(f"Affected categories: {affected_categories}")
 
-            # 重新加载分类列表（如果有新分类被恢复）
+            # 重新加载分类列表（如果有新分类被恢复，窗格不可见时推迟）
             if affected_categories:
-                self.load_categories()
+                self._request_categories_refresh()
 
             # 如果当前分类是受影响的分类之一，重新加载条目
             if self.current_category in affected_categories:
-                self.load_entries(self.current_category)
+                self._request_entries_refresh()
             # 如果根目录受影响，需要手动刷新
             elif "ROOT" in affected_categories:
                 self.on_refresh()
@@ -2463,12 +3446,14 @@ class NovelManagerGUI:
                                icon='warning', parent=self.root):
             try:
                 deleted_count, errors = self.manager.empty_trash()
+                if deleted_count > 0:
+                    self._note_fs_mutation()
                 if errors:
                     messagebox.showerror("清空错误",
                                          f"清空回收站时出错 ({len(errors)}项未删除):\n" + "\n".join(errors[:5]),
                                          parent=self.root)
                 elif deleted_count > 0:
-                    messagebox.showinfo("成功", f"回收站已清空 ({deleted_count}项已删除)。", parent=self.root)
+                    self._set_status(f"回收站已清空（{deleted_count}项已删除）")
                 else:
                     messagebox.showwarning("清空回收站", "尝试清空，但未删除任何项目 (可能为空或出错)。",
                                            parent=self.root)
@@ -2484,11 +3469,14 @@ class NovelManagerGUI:
             print("Debug: Category listbox or menu not found for context menu.")
             return
 
+        # 整表一次性快照，后续取项在Python侧完成
+        all_items = listbox.get(0, tk.END)
         clicked_index = listbox.nearest(event.y)
         on_item = False
         is_placeholder = False
 
-        if clicked_index >= 0:
+        # 下标越界（点击空白区）时直接跳过bbox的Tcl调用
+        if 0 <= clicked_index < len(all_items):
             bbox = listbox.bbox(clicked_index)
             # Check if click was within the vertical bounds of the item
             if bbox and (bbox[1] <= event.y < bbox[1] + bbox[3]):
@@ -2496,9 +3484,9 @@ class NovelManagerGUI:
                 # if (bbox[0] <= event.x < bbox[0] + bbox[2]):
                 on_item = True
                 try:
-                    item_text = listbox.get(clicked_index)
+                    item_text = all_items[clicked_index]
                     if item_text.startswith("("): is_placeholder = True
-                except (tk.TclError, IndexError):
+                except IndexError:
                     on_item = False  # Error getting item, treat as not on item
 
                 if on_item and not is_placeholder:
@@ -2509,20 +3497,22 @@ class NovelManagerGUI:
                         listbox.activate(clicked_index)
                         self.on_category_select(None)  # Trigger load for the clicked category
 
-        # --- Build Menu ---
-        menu.delete(0, tk.END)  # Clear previous items
-        menu.add_command(label="新建分类...", command=self.on_new_category)
-
+        # --- Configure Menu ---（结构固定，只调整标签和状态）
         selection = listbox.curselection()
-        # Only add rename/delete if exactly one *valid* item is selected AND the click was on that item
+        # Rename/delete only apply when exactly one *valid* item is selected AND the click was on it
+        selected_category = None
         if len(selection) == 1 and on_item and not is_placeholder and selection[0] == clicked_index:
             try:
-                selected_category = listbox.get(selection[0])
-                menu.add_separator()
-                menu.add_command(label=f"重命名 '{selected_category}'...", command=self.on_rename_category)
-                menu.add_command(label=f"删除 '{selected_category}' (回收站)", command=self.on_delete_selected_category)
-            except tk.TclError:
-                pass  # Item might have disappeared
+                selected_category = all_items[selection[0]]
+            except IndexError:
+                selected_category = None  # Item might have disappeared
+
+        if selected_category is not None:
+            menu.entryconfigure(2, label=f"重命名 '{selected_category}'...", state=tk.NORMAL)
+            menu.entryconfigure(3, label=f"删除 '{selected_category}' (回收站)", state=tk.NORMAL)
+        else:
+            menu.entryconfigure(2, label="重命名...", state=tk.DISABLED)
+            menu.entryconfigure(3, label="删除 (回收站)", state=tk.DISABLED)
 
         # Apply colors just before popping up
         self._apply_menu_colors()
@@ -2540,18 +3530,18 @@ class NovelManagerGUI:
             print("Debug: Entry listbox or menu not found for context menu.")
             return
 
+        # 取项直接走Python侧镜像，不经过Tcl
+        all_items = self._all_entry_titles
         clicked_index = listbox.nearest(event.y)
         on_item, actual_item_clicked = False, False
-        if clicked_index >= 0:
+        # 下标越界（点击空白区）时直接跳过bbox的Tcl调用
+        if 0 <= clicked_index < len(all_items):
             bbox = listbox.bbox(clicked_index)
             if bbox and (bbox[1] <= event.y < bbox[1] + bbox[3]):
                 # if (bbox[0] <= event.x < bbox[0] + bbox[2]): # Optional horizontal check
                 on_item = True
-                try:
-                    item_text = listbox.get(clicked_index)
-                    if not item_text.startswith("("): actual_item_clicked = True
-                except (tk.TclError, IndexError):
-                    on_item = False
+                if clicked_index not in self._placeholder_indices:
+                    actual_item_clicked = True
 
                 selection = listbox.curselection()
                 # If clicking on a valid item NOT in selection, select it exclusively
@@ -2561,52 +3551,54 @@ class NovelManagerGUI:
                     listbox.activate(clicked_index)
                     self.on_entry_select(None)  # Load single selection
 
-        # --- Build Menu ---
-        menu.delete(0, tk.END)
+        # --- Configure Menu ---（结构固定，只调整标签和状态）
         selection = listbox.curselection()  # Get potentially updated selection
         num_selected = len(selection)
 
-        # Add "New Entry" only if a category is currently selected in the left pane
-        if self.current_category:
-            menu.add_command(label="新建条目", command=self.on_new_entry)
-            menu.add_separator()
+        # "New Entry" only if a category is currently selected in the left pane
+        has_category = bool(self.current_category)
+        menu.entryconfigure(0, state=tk.NORMAL if has_category else tk.DISABLED)
 
-        # Add context items only if the click was on an item row
+        # Item actions only if the click was on an item row
+        valid_titles = []
+        has_placeholder = False
         if num_selected > 0 and on_item:
-            valid_titles = []
-            has_placeholder = False
             for idx in selection:
                 try:
-                    txt = listbox.get(idx)
-                    if txt.startswith("("):
+                    if idx in self._placeholder_indices:
                         has_placeholder = True;
                         break
-                    else:
-                        valid_titles.append(txt)
-                except (tk.TclError, IndexError):
+                    valid_titles.append(all_items[idx])
+                except IndexError:
                     has_placeholder = True;
                     break
 
-            if not has_placeholder and valid_titles:
-                # Single valid item selected AND it's the one clicked on
-                if num_selected == 1 and actual_item_clicked and selection[0] == clicked_index:
-                    title = valid_titles[0]
-                    menu.add_command(label=f"编辑 '{title}'", command=self.on_edit_selected_entry)
-                    menu.add_command(label=f"重命名 '{title}'...", command=self.on_rename_entry)
-                    menu.add_separator()
-                    menu.add_command(label=f"删除 '{title}' (回收站)", command=self.on_delete_selected_entries)
-                    menu.add_command(label=f"移动 '{title}' 到分类...", command=self.on_move_selected_entries)
-                # Multiple valid items selected (action applies to all selected)
-                elif num_selected > 0:
-                    menu.add_command(label=f"删除 {len(valid_titles)} 个条目 (回收站)",
-                                     command=self.on_delete_selected_entries)
-                    menu.add_command(label=f"移动 {len(valid_titles)} 个条目到分类...",
-                                     command=self.on_move_selected_entries)
+        item_actions = False
+        if not has_placeholder and valid_titles:
+            item_actions = True
+            # Single valid item selected AND it's the one clicked on
+            if num_selected == 1 and actual_item_clicked and selection[0] == clicked_index:
+                title = valid_titles[0]
+                menu.entryconfigure(2, label=f"编辑 '{title}'", state=tk.NORMAL)
+                menu.entryconfigure(3, label=f"重命名 '{title}'...", state=tk.NORMAL)
+                menu.entryconfigure(5, label=f"删除 '{title}' (回收站)", state=tk.NORMAL)
+                menu.entryconfigure(6, label=f"移动 '{title}' 到分类...", state=tk.NORMAL)
+            # Multiple valid items selected (action applies to all selected)
+            else:
+                menu.entryconfigure(2, label="编辑", state=tk.DISABLED)
+                menu.entryconfigure(3, label="重命名...", state=tk.DISABLED)
+                menu.entryconfigure(5, label=f"删除 {len(valid_titles)} 个条目 (回收站)", state=tk.NORMAL)
+                menu.entryconfigure(6, label=f"移动 {len(valid_titles)} 个条目到分类...", state=tk.NORMAL)
+        else:
+            menu.entryconfigure(2, label="编辑", state=tk.DISABLED)
+            menu.entryconfigure(3, label="重命名...", state=tk.DISABLED)
+            menu.entryconfigure(5, label="删除 (回收站)", state=tk.DISABLED)
+            menu.entryconfigure(6, label="移动到分类...", state=tk.DISABLED)
 
         # Apply colors just before popping up
         self._apply_menu_colors()
 
-        if menu.index(tk.END) is not None:  # Only show if menu has items
+        if has_category or item_actions:  # Only show if something is actionable
             try:
                 menu.tk_popup(event.x_root, event.y_root)
             finally:
@@ -2618,27 +3610,19 @@ class NovelManagerGUI:
         print(f"Switching theme to: {theme}")
         new_mode = theme.lower()
 
+        # 先只切换主题引擎并更新current_theme_mode，整树重排样式统一在末尾做一次
         if HAS_CTK:
             if new_mode in ["light", "dark", "system"]:
                 ctk.set_appearance_mode(new_mode)
                 # Update internal state AFTER setting it
                 self.current_theme_mode = ctk.get_appearance_mode().lower()
-                # Re-apply all theme-dependent settings
-                self._apply_theme()  # Updates root, listboxes, AND menus
-
-                # 更新所有列表框颜色
-                if hasattr(self, 'category_listbox') and self.category_listbox.winfo_exists():
-                    self._beautify_listbox(self.category_listbox)
-                if hasattr(self, 'entry_listbox') and self.entry_listbox.winfo_exists():
-                    self._beautify_listbox(self.entry_listbox)
             else:
                 print(f"Warning: Unknown CTk theme '{theme}'")
-        elif HAS_SVTTK:
+        elif _svttk_available():
             try:
                 if new_mode in ["light", "dark"]:
                     sv_ttk.set_theme(new_mode)
                     self.current_theme_mode = new_mode
-                    self._apply_theme()  # Update root BG for sv-ttk, try menus
                     self._setup_style()  # Re-apply ttk styles
                     self.root.update_idletasks()
                 else:
@@ -2648,7 +3632,8 @@ class NovelManagerGUI:
         else:
             print("No theme engine available to switch theme.")
 
-        # 切换主题后立即应用到所有UI元素
+        # 切换主题后统一应用到所有UI元素（只走一遍控件树）
+        self._refresh_active_colors()
         self._apply_theme()
         self._ensure_listbox_styling()  # 确保列表控件样式立即更新
 
@@ -2673,13 +3658,14 @@ class NovelManagerGUI:
 
                 # Try to reselect and reload the previously open entry
                 if path_before:
-                    path_obj = Path(path_before)
                     entry_found_and_reloaded = False
                     # Check if file still exists and is in the *correct* (current) category
-                    if path_obj.exists() and path_obj.is_file() and path_obj.parent.name == cat_before:
+                    # 单次isfile加字符串操作，替代Path构造和exists/is_file双重stat
+                    if (os.path.isfile(path_before)
+                            and os.path.basename(os.path.dirname(path_before)) == cat_before):
                         # Get title for selection
                         entry_data = self.manager.get_entry_by_path(path_before, read_content=False)
-                        title = path_obj.stem
+                        title = os.path.splitext(os.path.basename(path_before))[0]
                         if entry_data and entry_data.get("metadata", {}).get("title"): title = entry_data["metadata"][
                             "title"]
 
@@ -2695,7 +3681,7 @@ class NovelManagerGUI:
                             self.clear_editor()
             # If category changed or disappeared, load_categories handled the UI state
 
-            messagebox.showinfo("刷新完成", "已从文件系统刷新。", parent=self.root)
+            self._set_status("已从文件系统刷新")
 
         except Exception as e:
             messagebox.showerror("刷新错误", f"刷新时发生错误:\n{e}", parent=self.root)
@@ -2711,19 +3697,28 @@ class NovelManagerGUI:
             top_button_frame = ctk.CTkFrame(frame, fg_color="transparent")
             top_button_frame.pack(fill=tk.X, padx=10, pady=(10, 5))
             
+            # 颜色/字体参数一次算好，后续按钮直接展开复用
+            colors = self._active_colors
+            blue_btn_kwargs = dict(
+                font=self._ui_font,
+                fg_color=colors["button_blue"],
+                hover_color=colors["button_blue_hover"],
+                text_color=colors["list_select_fg"],
+            )
+            red_btn_kwargs = dict(
+                font=self._ui_font,
+                fg_color=colors["button_red"],
+                hover_color=colors["button_red_hover"],
+                text_color=colors["list_select_fg"],
+            )
+
             # 日志按钮
-            mode = "dark" if ctk.get_appearance_mode().lower() == "dark" else "light"
-            colors = self.soft_colors[mode]
-            
             log_button = ctk.CTkButton(
                 top_button_frame,
                 text="日志",
                 width=60,
-                font=("Microsoft YaHei UI", 15),
                 command=self.show_log_window,
-                fg_color=colors["button_blue"],
-                hover_color=colors["button_blue_hover"],
-                text_color=colors["list_select_fg"]
+                **blue_btn_kwargs
             )
             log_button.pack(side=tk.LEFT, padx=(0, 5))
 
@@ -2732,15 +3727,12 @@ class NovelManagerGUI:
                 top_button_frame,
                 text="主题",
                 width=60,
-                font=("Microsoft YaHei UI", 15),
                 command=self._show_theme_dialog,
-                fg_color=colors["button_blue"],
-                hover_color=colors["button_blue_hover"],
-                text_color=colors["list_select_fg"]
+                **blue_btn_kwargs
             )
             theme_button.pack(side=tk.LEFT, padx=(0, 5))
 
-            # 添加字体按钮
+            # 添加字体按钮（跟随当前字体设置，不用统一字体参数）
             font_button = ctk.CTkButton(
                 top_button_frame,
                 text="字体",
@@ -2758,11 +3750,8 @@ class NovelManagerGUI:
                 top_button_frame,
                 text="回收站",
                 width=70,
-                font=("Microsoft YaHei UI", 15),
                 command=self.on_view_trash,
-                fg_color=colors["button_blue"],
-                hover_color=colors["button_blue_hover"],
-                text_color=colors["list_select_fg"]
+                **blue_btn_kwargs
             )
             trash_button.pack(side=tk.LEFT, padx=(0, 5))
 
@@ -2771,11 +3760,8 @@ class NovelManagerGUI:
                 top_button_frame,
                 text="清空回收站",
                 width=90,
-                font=("Microsoft YaHei UI", 15),
-                fg_color=colors["button_red"],
-                hover_color=colors["button_red_hover"],
-                text_color=colors["list_select_fg"],
-                command=self.on_empty_trash
+                command=self.on_empty_trash,
+                **red_btn_kwargs
             )
             empty_trash.pack(side=tk.LEFT)
 
@@ -2784,11 +3770,8 @@ class NovelManagerGUI:
                 top_button_frame,
                 text="退出",
                 width=50,
-                font=("Microsoft YaHei UI", 15),
-                fg_color=colors["button_red"],
-                hover_color=colors["button_red_hover"],
-                text_color=colors["list_select_fg"],
-                command=self.root.quit
+                command=self.root.quit,
+                **red_btn_kwargs
             )
             exit_button.pack(side=tk.RIGHT)
 
@@ -2801,11 +3784,8 @@ class NovelManagerGUI:
                 ai_frame,
                 text="AI配置",
                 width=85,
-                font=("Microsoft YaHei UI", 15),
                 command=self.on_ai_config,
-                fg_color=colors["button_blue"],
-                hover_color=colors["button_blue_hover"],
-                text_color=colors["list_select_fg"]
+                **blue_btn_kwargs
             )
             ai_config_btn.pack(side=tk.LEFT, padx=(0, 5))
 
@@ -2814,11 +3794,8 @@ class NovelManagerGUI:
                 ai_frame,
                 text="AI精简",
                 width=85,
-                font=("Microsoft YaHei UI", 15),
                 command=self.on_ai_condenser,
-                fg_color=colors["button_blue"],
-                hover_color=colors["button_blue_hover"],
-                text_color=colors["list_select_fg"]
+                **blue_btn_kwargs
             )
             ai_condenser_btn.pack(side=tk.LEFT, padx=(0, 5))
             
@@ -2827,7 +3804,7 @@ class NovelManagerGUI:
                 ai_frame,
                 text="AI优化",
                 width=85,
-                font=("Microsoft YaHei UI", 15),
+                font=self._ui_font,
                 command=self.on_ai_optimize,
                 fg_color=colors["button_green"],
                 hover_color=colors["button_green_hover"],
@@ -2842,7 +3819,7 @@ class NovelManagerGUI:
             list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 5))
 
             self.category_listbox = tk.Listbox(list_frame, exportselection=False, relief=tk.FLAT,
-                                               borderwidth=0, font=("Microsoft YaHei UI", 15), activestyle='none')
+                                               borderwidth=0, font="NovelBody", activestyle='none')
 
             cat_scrollbar = ctk.CTkScrollbar(list_frame, command=self.category_listbox.yview)
             self.category_listbox.config(yscrollcommand=cat_scrollbar.set)
@@ -2861,28 +3838,20 @@ class NovelManagerGUI:
                 text="新建分类",
                 width=90,
                 command=self.on_new_category,
-                font=("Microsoft YaHei UI", 15),
-                fg_color=colors["button_blue"],
-                hover_color=colors["button_blue_hover"],
-                text_color=colors["list_select_fg"]
+                **blue_btn_kwargs
             ).pack(side=tk.LEFT, padx=(0, 5))
 
             # --- >> Added Delete Category Button << ---
             # Use a distinct color for delete button if possible
             ctk.CTkButton(cat_button_frame, text="删除分类", width=90, command=self.on_delete_selected_category,
-                          font=("Microsoft YaHei UI", 15), fg_color=colors["button_red"],
-                          hover_color=colors["button_red_hover"],
-                          text_color=colors["list_select_fg"]).pack(side=tk.LEFT, padx=(5, 5))
+                          **red_btn_kwargs).pack(side=tk.LEFT, padx=(5, 5))
 
             ctk.CTkButton(
                 cat_button_frame,
                 text="刷新",
                 width=60,
                 command=self.on_refresh,
-                font=("Microsoft YaHei UI", 15),
-                fg_color=colors["button_blue"],
-                hover_color=colors["button_blue_hover"],
-                text_color=colors["list_select_fg"]
+                **blue_btn_kwargs
             ).pack(side=tk.RIGHT, padx=(5, 0))
 
             return frame
@@ -2926,6 +3895,7 @@ class NovelManagerGUI:
             list_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 5))
             cat_scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL)
             self.category_listbox = tk.Listbox(list_frame, yscrollcommand=cat_scrollbar.set, exportselection=False,
+                                               font="NovelBody",
                                                borderwidth=1, relief=tk.FLAT)
             cat_scrollbar.config(command=self.category_listbox.yview)
             cat_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -2955,25 +3925,25 @@ class NovelManagerGUI:
                                                                                            padx=(0, 8))  # 增大字号和右边距
 
             self.search_var = tk.StringVar()
-            search_entry = ctk.CTkEntry(search_frame, textvariable=self.search_var, font=("Microsoft YaHei UI", 15),
+            search_entry = ctk.CTkEntry(search_frame, textvariable=self.search_var, font=self._ui_font,
                                         height=30)  # 微调高度
             search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 8))
             search_entry.bind("<Return>", self.on_search)
             search_entry.bind("<Escape>", self.on_clear_search)  # 绑定 Escape 键清除搜索
+            search_entry.bind("<KeyRelease>", self._debounced_search)  # 边输入边搜索（防抖）
 
             # 获取当前主题的柔和颜色
-            mode = "dark" if ctk.get_appearance_mode().lower() == "dark" else "light"
-            colors = self.soft_colors[mode]
+            colors = self._active_colors
 
             # 将"搜索"按钮文字改为"查找"，并应用柔和颜色
             ctk.CTkButton(search_frame, text="查找", width=60, height=30, command=self.on_search,
-                          font=("Microsoft YaHei UI", 15),
+                          font=self._ui_font,
                           fg_color=colors["button_blue"],
                           hover_color=colors["button_blue_hover"],
                           text_color=colors["list_select_fg"]).pack(side=tk.LEFT, padx=(0, 5))
 
             ctk.CTkButton(search_frame, text="清除", width=60, height=30, command=self.on_clear_search,
-                          font=("Microsoft YaHei UI", 15),
+                          font=self._ui_font,
                           fg_color=colors["button_blue"],
                           hover_color=colors["button_blue_hover"],
                           text_color=colors["list_select_fg"]).pack(side=tk.LEFT)
@@ -2992,7 +3962,7 @@ class NovelManagerGUI:
                 exportselection=False,
                 relief=tk.FLAT,
                 borderwidth=0,
-                font=("Microsoft YaHei UI", 15),
+                font="NovelBody",
                 activestyle='none'  # 去除选中虚线
             )
 
@@ -3002,7 +3972,7 @@ class NovelManagerGUI:
             entry_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
             self.entry_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-            self.entry_listbox.bind("<<ListboxSelect>>", self.on_entry_select)
+            self.entry_listbox.bind("<<ListboxSelect>>", self._on_entry_select_debounced)
             self.entry_listbox.bind("<Double-1>", self.on_edit_selected_entry)
             self.entry_listbox.bind("<Button-3>", self.show_entry_menu)  # 右键菜单
 
@@ -3015,7 +3985,7 @@ class NovelManagerGUI:
                 text="新建",
                 width=60,
                 command=self.on_new_entry,
-                font=("Microsoft YaHei UI", 15),
+                font=self._ui_font,
                 fg_color=colors["button_blue"],
                 hover_color=colors["button_blue_hover"],
                 text_color=colors["list_select_fg"]
@@ -3026,7 +3996,7 @@ class NovelManagerGUI:
                 text="重命名",
                 width=70,
                 command=self.on_rename_entry,
-                font=("Microsoft YaHei UI", 15),
+                font=self._ui_font,
                 fg_color=colors["button_blue"],
                 hover_color=colors["button_blue_hover"],
                 text_color=colors["list_select_fg"]
@@ -3037,7 +4007,7 @@ class NovelManagerGUI:
                 button_frame,
                 text="删除",
                 width=60,
-                font=("Microsoft YaHei UI", 15),
+                font=self._ui_font,
                 fg_color=colors["button_red"],
                 hover_color=colors["button_red_hover"],
                 text_color=colors["list_select_fg"],
@@ -3052,8 +4022,11 @@ class NovelManagerGUI:
             search_frame.pack(fill=tk.X, pady=(0, 5))
             ttk.Label(search_frame, text="搜索:").pack(side=tk.LEFT, padx=(0, 5))
             self.search_var = tk.StringVar()
-            ttk.Entry(search_frame, textvariable=self.search_var).pack(side=tk.LEFT, fill=tk.X, expand=True,
-                                                                       padx=(0, 5))
+            search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
+            search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+            search_entry.bind("<Return>", self.on_search)
+            search_entry.bind("<Escape>", self.on_clear_search)
+            search_entry.bind("<KeyRelease>", self._debounced_search)  # 边输入边搜索（防抖）
             ttk.Button(search_frame, text="查找", width=6, command=self.on_search).pack(side=tk.LEFT, padx=(0, 5))
             ttk.Button(search_frame, text="清除", width=6, command=self.on_clear_search).pack(side=tk.LEFT)
             self.entry_list_label = ttk.Label(frame, text="条目列表", font=("", 11, "bold"))
@@ -3062,11 +4035,12 @@ class NovelManagerGUI:
             list_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 5))
             entry_scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL)
             self.entry_listbox = tk.Listbox(list_frame, yscrollcommand=entry_scrollbar.set, exportselection=False,
+                                            font="NovelBody",
                                             borderwidth=1, relief=tk.FLAT)
             entry_scrollbar.config(command=self.entry_listbox.yview)
             entry_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
             self.entry_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-            self.entry_listbox.bind("<<ListboxSelect>>", self.on_entry_select)
+            self.entry_listbox.bind("<<ListboxSelect>>", self._on_entry_select_debounced)
             self.entry_listbox.bind("<Double-1>", self.on_edit_selected_entry)
             self.entry_listbox.bind("<Button-3>", self.show_entry_menu)
             button_frame = ttk.Frame(frame)
@@ -3088,20 +4062,20 @@ class NovelManagerGUI:
             # 标题输入行
             title_frame = ctk.CTkFrame(editor_top_frame, fg_color="transparent")
             title_frame.pack(fill=tk.X, pady=(0, 8))  # 增加下方间距
-            ctk.CTkLabel(title_frame, text="标题:", width=50, font=("Microsoft YaHei UI", 13)).pack(side=tk.LEFT,
+            ctk.CTkLabel(title_frame, text="标题:", width=50, font=self._ui_font_small).pack(side=tk.LEFT,
                                                                                                     padx=(0, 8))
             self.title_var = tk.StringVar()
-            title_entry = ctk.CTkEntry(title_frame, textvariable=self.title_var, font=("Microsoft YaHei UI", 13),
+            title_entry = ctk.CTkEntry(title_frame, textvariable=self.title_var, font=self._ui_font_small,
                                        height=32)  # 微调高度
             title_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
             # 标签输入行
             tags_frame = ctk.CTkFrame(editor_top_frame, fg_color="transparent")
             tags_frame.pack(fill=tk.X, pady=(0, 8))
-            ctk.CTkLabel(tags_frame, text="标签:", width=50, font=("Microsoft YaHei UI", 15)).pack(side=tk.LEFT,
+            ctk.CTkLabel(tags_frame, text="标签:", width=50, font=self._ui_font).pack(side=tk.LEFT,
                                                                                                    padx=(0, 8))
             self.tags_var = tk.StringVar()
-            tags_entry = ctk.CTkEntry(tags_frame, textvariable=self.tags_var, font=("Microsoft YaHei UI", 15),
+            tags_entry = ctk.CTkEntry(tags_frame, textvariable=self.tags_var, font=self._ui_font,
                                       height=30)
             tags_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
             ctk.CTkLabel(tags_frame, text="(逗号分隔)", font=("Microsoft YaHei UI", 10, "italic"),
@@ -3135,12 +4109,15 @@ class NovelManagerGUI:
             self.content_text = ctk.CTkTextbox(
                 content_frame,
                 wrap="word",  # 自动换行
-                font=("Microsoft YaHei UI", 13),  # 稍大字体
+                font=self._ui_font_small,  # 稍大字体
                 border_width=1,  # 设置边框宽度
                 fg_color="#2b2b2b",  # 与分类和条目列表一致的深灰色背景
                 text_color="white",  # 白色文字以提高可读性
             )
             self.content_text.pack(fill=tk.BOTH, expand=True)
+            # 编辑器控件类型只在创建时判定一次，热路径直接用缓存的起始索引
+            self._editor_is_ctk = True
+            self._editor_start = "0.0"
 
             # 绑定文本变更事件来更新字数统计
             self.content_text.bind("<<Modified>>", self._update_word_count)
@@ -3156,8 +4133,7 @@ class NovelManagerGUI:
             save_frame.pack(fill=tk.X, padx=10, pady=(5, 10))
 
             # 获取当前主题的柔和颜色
-            mode = "dark" if ctk.get_appearance_mode().lower() == "dark" else "light"
-            colors = self.soft_colors[mode]
+            colors = self._active_colors
 
             # 创建两个按钮：新建和保存
             buttons_frame = ctk.CTkFrame(save_frame, fg_color="transparent")
@@ -3168,7 +4144,7 @@ class NovelManagerGUI:
                 buttons_frame,
                 text="保存修改",
                 command=lambda: self._set_save_source_and_save("update"),
-                font=("Microsoft YaHei UI", 14, "bold"),
+                font=self._ui_font_bold,
                 height=40,
                 fg_color=colors["button_green"],
                 hover_color=colors["button_green_hover"],
@@ -3180,7 +4156,7 @@ class NovelManagerGUI:
                 buttons_frame,
                 text="另存为新建",
                 command=lambda: self._set_save_source_and_save("new"),
-                font=("Microsoft YaHei UI", 14, "bold"),
+                font=self._ui_font_bold,
                 height=40,
                 fg_color=colors["button_blue"],
                 hover_color=colors["button_blue_hover"],
@@ -3230,10 +4206,14 @@ class NovelManagerGUI:
             editor_scrollbar = ttk.Scrollbar(content_frame, orient=tk.VERTICAL)
             # 使用 tk.Text 以支持 undo 功能
             self.content_text = tk.Text(content_frame, wrap="word", relief=tk.FLAT, borderwidth=1, undo=True,
+                                        font="NovelBody",
                                         yscrollcommand=editor_scrollbar.set)
             editor_scrollbar.config(command=self.content_text.yview)
             editor_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
             self.content_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            # 编辑器控件类型只在创建时判定一次，热路径直接用缓存的起始索引
+            self._editor_is_ctk = False
+            self._editor_start = "1.0"
 
             # 绑定文本变更事件来更新字数统计
             self.content_text.bind("<<Modified>>", self._update_word_count)
@@ -3255,9 +4235,29 @@ class NovelManagerGUI:
             return frame
 
     def _create_right_pane(self, parent):
-        """创建编辑器面板"""
+        """创建编辑器面板的占位容器，内部控件推迟到首次打开条目时构建"""
         if HAS_CTK:
             frame = ctk.CTkFrame(parent, corner_radius=0, border_width=0)  # 融入 PanedWindow
+        else:
+            frame = ttk.Frame(parent, padding=5)
+        self._right_pane_frame = frame
+        self._right_pane_built = False
+        return frame
+
+    def _ensure_right_pane_built(self):
+        """按需构建右侧编辑区；已构建时为空操作"""
+        if self._right_pane_built:
+            return
+        self._right_pane_built = True
+        self._build_right_pane(self._right_pane_frame)
+        # 迟建的控件不在字体注册表里；用户改过字体时补应用一次
+        self._font_registry = None
+        if (self.current_font, self.font_size) != ("Microsoft YaHei UI", 15):
+            self._apply_font_settings()
+
+    def _build_right_pane(self, frame):
+        """构建编辑器控件（标题/标签/信息/正文/保存按钮）"""
+        if HAS_CTK:
 
             # --- 顶部编辑器框架 (标题、标签、信息) ---
             editor_top_frame = ctk.CTkFrame(frame, fg_color="transparent")
@@ -3266,22 +4266,23 @@ class NovelManagerGUI:
             # 标题输入行
             title_frame = ctk.CTkFrame(editor_top_frame, fg_color="transparent")
             title_frame.pack(fill=tk.X, pady=(0, 8))  # 增加下方间距
-            ctk.CTkLabel(title_frame, text="标题:", width=50, font=("Microsoft YaHei UI", 13)).pack(side=tk.LEFT,
+            ctk.CTkLabel(title_frame, text="标题:", width=50, font=self._ui_font_small).pack(side=tk.LEFT,
                                                                                                     padx=(0, 8))
-            self.title_var = tk.StringVar()
-            title_entry = ctk.CTkEntry(title_frame, textvariable=self.title_var, font=("Microsoft YaHei UI", 13),
+            title_entry = ctk.CTkEntry(title_frame, textvariable=self.title_var, font=self._ui_font_small,
                                        height=32)  # 微调高度
             title_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+            # 创建时即保存引用，后续按需访问无需遍历控件树
+            self.title_entry = title_entry
 
             # 标签输入行
             tags_frame = ctk.CTkFrame(editor_top_frame, fg_color="transparent")
             tags_frame.pack(fill=tk.X, pady=(0, 8))
-            ctk.CTkLabel(tags_frame, text="标签:", width=50, font=("Microsoft YaHei UI", 15)).pack(side=tk.LEFT,
+            ctk.CTkLabel(tags_frame, text="标签:", width=50, font=self._ui_font).pack(side=tk.LEFT,
                                                                                                    padx=(0, 8))
-            self.tags_var = tk.StringVar()
-            tags_entry = ctk.CTkEntry(tags_frame, textvariable=self.tags_var, font=("Microsoft YaHei UI", 15),
+            tags_entry = ctk.CTkEntry(tags_frame, textvariable=self.tags_var, font=self._ui_font,
                                       height=30)
             tags_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+            self.tags_entry = tags_entry
             ctk.CTkLabel(tags_frame, text="(逗号分隔)", font=("Microsoft YaHei UI", 10, "italic"),
                          text_color="gray").pack(side=tk.LEFT, padx=(8, 0))
 
@@ -3290,7 +4291,6 @@ class NovelManagerGUI:
             info_stats_frame.pack(fill=tk.X, pady=(0, 5))
 
             # 信息标签 (创建/更新日期) - 增大字号
-            self.info_label_var = tk.StringVar(value="未加载条目")
             info_label = ctk.CTkLabel(info_stats_frame, textvariable=self.info_label_var,
                                       font=("Microsoft YaHei UI", 12), text_color="gray")
             info_label.pack(side=tk.LEFT, fill=tk.X, pady=(5, 0))
@@ -3300,7 +4300,6 @@ class NovelManagerGUI:
             stats_frame.pack(fill=tk.X, pady=(0, 5))
 
             # 新增：字数统计标签
-            self.word_count_var = tk.StringVar(value="字数: 0 | 英文: 0 | 符号: 0 | 字符: 0 | 行数: 0")
             word_count_label = ctk.CTkLabel(stats_frame, textvariable=self.word_count_var,
                                             font=("Microsoft YaHei UI", 12), text_color="gray")
             word_count_label.pack(side=tk.LEFT, fill=tk.X, pady=(0, 5))
@@ -3313,12 +4312,15 @@ class NovelManagerGUI:
             self.content_text = ctk.CTkTextbox(
                 content_frame,
                 wrap="word",  # 自动换行
-                font=("Microsoft YaHei UI", 13),  # 稍大字体
+                font=self._ui_font_small,  # 稍大字体
                 border_width=1,  # 设置边框宽度
                 fg_color="#2b2b2b",  # 与分类和条目列表一致的深灰色背景
                 text_color="white",  # 白色文字以提高可读性
             )
             self.content_text.pack(fill=tk.BOTH, expand=True)
+            # 编辑器控件类型只在创建时判定一次，热路径直接用缓存的起始索引
+            self._editor_is_ctk = True
+            self._editor_start = "0.0"
 
             # 绑定文本变更事件来更新字数统计
             self.content_text.bind("<<Modified>>", self._update_word_count)
@@ -3334,8 +4336,7 @@ class NovelManagerGUI:
             save_frame.pack(fill=tk.X, padx=10, pady=(5, 10))
 
             # 获取当前主题的柔和颜色
-            mode = "dark" if ctk.get_appearance_mode().lower() == "dark" else "light"
-            colors = self.soft_colors[mode]
+            colors = self._active_colors
 
             # 创建两个按钮：新建和保存
             buttons_frame = ctk.CTkFrame(save_frame, fg_color="transparent")
@@ -3346,7 +4347,7 @@ class NovelManagerGUI:
                 buttons_frame,
                 text="保存修改",
                 command=lambda: self._set_save_source_and_save("update"),
-                font=("Microsoft YaHei UI", 14, "bold"),
+                font=self._ui_font_bold,
                 height=40,
                 fg_color=colors["button_green"],
                 hover_color=colors["button_green_hover"],
@@ -3358,31 +4359,28 @@ class NovelManagerGUI:
                 buttons_frame,
                 text="另存为新建",
                 command=lambda: self._set_save_source_and_save("new"),
-                font=("Microsoft YaHei UI", 14, "bold"),
+                font=self._ui_font_bold,
                 height=40,
                 fg_color=colors["button_blue"],
                 hover_color=colors["button_blue_hover"],
                 text_color=colors["list_select_fg"]
             ).pack(side=tk.LEFT, fill=tk.X, expand=True)
 
-            return frame
-
         else:  # 回退到 ttk 实现
-            frame = ttk.Frame(parent, padding=5)
             editor_top_frame = ttk.Frame(frame)
             editor_top_frame.pack(fill=tk.X, pady=(0, 5))
             # Title row
             title_frame = ttk.Frame(editor_top_frame)
             title_frame.pack(fill=tk.X, pady=(0, 3))
             ttk.Label(title_frame, text="标题:", width=6).pack(side=tk.LEFT, padx=(0, 5))
-            self.title_var = tk.StringVar()
-            ttk.Entry(title_frame, textvariable=self.title_var).pack(side=tk.LEFT, fill=tk.X, expand=True)
+            self.title_entry = ttk.Entry(title_frame, textvariable=self.title_var)
+            self.title_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
             # Tags row
             tags_frame = ttk.Frame(editor_top_frame)
             tags_frame.pack(fill=tk.X, pady=(0, 3))
             ttk.Label(tags_frame, text="标签:", width=6).pack(side=tk.LEFT, padx=(0, 5))
-            self.tags_var = tk.StringVar()
-            ttk.Entry(tags_frame, textvariable=self.tags_var).pack(side=tk.LEFT, fill=tk.X, expand=True)
+            self.tags_entry = ttk.Entry(tags_frame, textvariable=self.tags_var)
+            self.tags_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
             ttk.Label(tags_frame, text="(逗号分隔)", font=("", 8, "italic")).pack(side=tk.LEFT, padx=(5, 0))
 
             # 信息行
@@ -3390,14 +4388,12 @@ class NovelManagerGUI:
             info_frame.pack(fill=tk.X, pady=(3, 0))
 
             # Info Label - 增大字号
-            self.info_label_var = tk.StringVar(value="未加载条目")
             info_label = ttk.Label(info_frame, textvariable=self.info_label_var, font=("", 10), foreground="gray")
             info_label.pack(side=tk.LEFT, fill=tk.X)
 
             # 新增：字数统计标签（单独一行）
             stats_frame = ttk.Frame(editor_top_frame)
             stats_frame.pack(fill=tk.X, pady=(3, 0))
-            self.word_count_var = tk.StringVar(value="字数: 0 | 英文: 0 | 符号: 0 | 字符: 0 | 行数: 0")
             word_count_label = ttk.Label(stats_frame, textvariable=self.word_count_var, font=("", 10),
                                          foreground="gray")
             word_count_label.pack(side=tk.LEFT, fill=tk.X)
@@ -3408,10 +4404,14 @@ class NovelManagerGUI:
             editor_scrollbar = ttk.Scrollbar(content_frame, orient=tk.VERTICAL)
             # 使用 tk.Text 以支持 undo 功能
             self.content_text = tk.Text(content_frame, wrap="word", relief=tk.FLAT, borderwidth=1, undo=True,
+                                        font="NovelBody",
                                         yscrollcommand=editor_scrollbar.set)
             editor_scrollbar.config(command=self.content_text.yview)
             editor_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
             self.content_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            # 编辑器控件类型只在创建时判定一次，热路径直接用缓存的起始索引
+            self._editor_is_ctk = False
+            self._editor_start = "1.0"
 
             # 绑定文本变更事件来更新字数统计
             self.content_text.bind("<<Modified>>", self._update_word_count)
@@ -3430,8 +4430,6 @@ class NovelManagerGUI:
             ttk.Button(buttons_frame, text="另存为新建", command=lambda: self._set_save_source_and_save("new")).pack(
                 side=tk.LEFT, fill=tk.X, expand=True, padx=(2, 0))
 
-            return frame
-
     # --- 添加主题切换对话框方法 ---
     def _show_theme_dialog(self):
         """显示主题选择对话框"""
@@ -3447,8 +4445,7 @@ class NovelManagerGUI:
             theme_dialog.protocol("WM_DELETE_WINDOW", lambda: theme_dialog.destroy())
 
             # 获取当前主题颜色
-            mode = "dark" if ctk.get_appearance_mode().lower() == "dark" else "light"
-            colors = self.soft_colors[mode]
+            colors = self._active_colors
 
             ctk.CTkLabel(theme_dialog, text="选择界面主题",
                          font=("Microsoft YaHei UI", 16, "bold")).pack(pady=(20, 25))
@@ -3457,7 +4454,7 @@ class NovelManagerGUI:
             button_frame.pack(fill=tk.X, padx=20, pady=10)
 
             ctk.CTkButton(button_frame, text="亮色", width=80, height=35,
-                          font=("Microsoft YaHei UI", 15),
+                          font=self._ui_font,
                           fg_color=colors["button_blue"],
                           hover_color=colors["button_blue_hover"],
                           text_color=colors["list_select_fg"],
@@ -3465,7 +4462,7 @@ class NovelManagerGUI:
                           ).pack(side=tk.LEFT, padx=(0, 10))
 
             ctk.CTkButton(button_frame, text="暗色", width=80, height=35,
-                          font=("Microsoft YaHei UI", 15),
+                          font=self._ui_font,
                           fg_color=colors["button_blue"],
                           hover_color=colors["button_blue_hover"],
                           text_color=colors["list_select_fg"],
@@ -3473,13 +4470,13 @@ class NovelManagerGUI:
                           ).pack(side=tk.LEFT, padx=(0, 10))
 
             ctk.CTkButton(button_frame, text="跟随系统", width=100, height=35,
-                          font=("Microsoft YaHei UI", 15),
+                          font=self._ui_font,
                           fg_color=colors["button_blue"],
                           hover_color=colors["button_blue_hover"],
                           text_color=colors["list_select_fg"],
                           command=lambda: [self.switch_theme("system"), theme_dialog.destroy()]
                           ).pack(side=tk.LEFT)
-        elif HAS_SVTTK:
+        elif _svttk_available():
             theme_dialog = Toplevel(self.root)
             theme_dialog.title("选择主题")
             theme_dialog.geometry("250x150")
@@ -3517,8 +4514,41 @@ class NovelManagerGUI:
 
         print(f"正在应用字体: {self.current_font}, 大小: {self.font_size}")
 
-        # 更新所有已创建控件的字体
-        updated_count = self._update_widgets_font(self.root)
+        # 命名字体原子更新：绑定这些名字的控件由Tk内部统一重排，无需逐个configure
+        try:
+            self._named_fonts["NovelBody"].configure(family=self.current_font, size=self.font_size)
+            self._named_fonts["NovelSmall"].configure(family=self.current_font,
+                                                      size=max(self.font_size - 2, 8))
+        except tk.TclError as e:
+            print(f"更新命名字体时出错: {e}")
+
+        # 注册表只在首次（或界面结构变化后）分类一次，之后的字体变更直接遍历
+        if self._font_registry is None:
+            self._font_registry = []
+            self._collect_font_widgets(self.root, self._font_registry)
+            print(f"已登记 {len(self._font_registry)} 个带字体的控件")
+
+        updated_count = 0
+        dead_widgets = []
+        for child, kind in self._font_registry:
+            try:
+                if kind == "ctk":
+                    child.configure(font=(self.current_font, self.font_size))
+                else:
+                    size, weight = kind
+                    if size is None:
+                        # 字符串字体描述的控件跟随配置的字号
+                        size = self.font_size
+                    child.configure(font=(self.current_font, size, weight))
+                updated_count += 1
+            except tk.TclError:
+                # 控件已销毁，从注册表剔除
+                dead_widgets.append(child)
+            except Exception as e:
+                print(f"更新{child.__class__.__name__}字体时出错: {e}")
+        if dead_widgets:
+            dead = set(dead_widgets)
+            self._font_registry = [item for item in self._font_registry if item[0] not in dead]
         print(f"已更新 {updated_count} 个控件的字体")
 
         # 不再使用不存在的set_default_font方法
@@ -3559,92 +4589,50 @@ class NovelManagerGUI:
         print("已强制刷新界面")
         return updated_count
 
-    def _update_widgets_font(self, parent):
-        """递归更新所有控件的字体"""
-        updated_count = 0
-
-        # 定义不支持字体属性的CTk控件类型列表
-        unsupported_ctk_widgets = [
-            'CTkFrame', 'CTkCanvas', 'CTkScrollbar',
-            'CTkProgressBar', 'CTkTabview', 'CTkSegmentedButton'
-        ]
-
-        # 定义支持字体的CTk控件类型列表(白名单方式更安全)
-        supported_ctk_widgets = [
+    def _collect_font_widgets(self, parent, registry):
+        """一次性遍历控件树，把带字体的控件连同解析好的尺寸/字重登记下来"""
+        # 已知支持字体的CTk控件类型列表(白名单方式更安全)
+        supported_ctk_widgets = (
             'CTkLabel', 'CTkButton', 'CTkEntry', 'CTkCheckBox',
             'CTkRadioButton', 'CTkComboBox', 'CTkOptionMenu',
             'CTkTextbox', 'CTkSwitch'
-        ]
+        )
 
-        for child in parent.winfo_children():
+        stack = deque([parent])
+        while stack:
+            widget = stack.popleft()
             try:
-                # 检查控件类型
+                children = widget.winfo_children()
+            except tk.TclError:
+                continue
+            for child in children:
                 widget_class = child.__class__.__name__
-
-                # 处理CTk控件
                 if HAS_CTK and widget_class.startswith('CTk'):
-                    # 跳过已知不支持字体的控件类型
-                    if widget_class in unsupported_ctk_widgets:
-                        pass
-                    # 只处理已知支持字体的控件
-                    elif widget_class in supported_ctk_widgets:
-                        try:
-                            child.configure(font=(self.current_font, self.font_size))
-                            updated_count += 1
-                        except Exception as e:
-                            # 降低日志级别，避免大量输出
-                            if "font" in str(e).lower():
-                                # 这是预期中的"不支持font"错误
-                                pass
-                            else:
-                                # 其他未预期的错误
-                                print(f"更新{widget_class}字体时出错: {e}")
-                    else:
-                        # 对于未知的CTk控件，尝试更新但捕获并忽略错误
-                        try:
-                            child.configure(font=(self.current_font, self.font_size))
-                            updated_count += 1
-                        except:
-                            pass
+                    if widget_class in supported_ctk_widgets:
+                        registry.append((child, "ctk"))
                 else:
-                    # 标准Tkinter控件处理
+                    # 标准Tkinter控件：登记时解析一次现有字体的尺寸和字重
                     try:
-                        # 检查此控件是否有font属性
                         current_font = child.cget('font')
-                        if current_font:
-                            # 提取字体大小和样式
-                            if isinstance(current_font, str):
-                                # 解析字符串字体描述
-                                parts = current_font.split()
-                                size = self.font_size  # 使用配置的字体大小
-                                weight = "normal"
-                                for part in parts:
-                                    if part in ["bold", "italic"]:
-                                        weight = part
-
-                                # 设置新字体
-                                child.configure(font=(self.current_font, size, weight))
-                                updated_count += 1
-                            elif isinstance(current_font, tuple):
-                                # 已经是元组形式的字体
-                                size = current_font[1] if len(current_font) > 1 else self.font_size
-                                weight = current_font[2] if len(current_font) > 2 else "normal"
-                                child.configure(font=(self.current_font, size, weight))
-                                updated_count += 1
                     except (tk.TclError, AttributeError):
-                        # 忽略无字体属性的控件
-                        pass
-
-            except Exception as e:
-                # 只记录真正的未知错误
-                print(f"处理控件字体时发生未知错误: {e}")
-
-            # 递归处理子控件
-            if child.winfo_children():
-                sub_updated = self._update_widgets_font(child)
-                updated_count += sub_updated
-
-        return updated_count
+                        current_font = None
+                    if isinstance(current_font, str) and current_font in self._named_fonts:
+                        # 绑定命名字体的控件由字体对象本身更新，不进注册表
+                        current_font = None
+                    if current_font:
+                        size = None  # None表示应用时取当前配置的字号
+                        weight = "normal"
+                        if isinstance(current_font, str):
+                            for part in current_font.split():
+                                if part in ("bold", "italic"):
+                                    weight = part
+                        elif isinstance(current_font, tuple):
+                            if len(current_font) > 1:
+                                size = current_font[1]
+                            if len(current_font) > 2:
+                                weight = current_font[2]
+                        registry.append((child, (size, weight)))
+                stack.append(child)
 
     # --- 修复字体选择对话框按钮颜色 ---
     def show_font_dialog(self):
@@ -3666,8 +4654,7 @@ class NovelManagerGUI:
             font_dialog.protocol("WM_DELETE_WINDOW", lambda: font_dialog.destroy())
 
             # 获取当前主题的柔和颜色
-            mode = "dark" if ctk.get_appearance_mode().lower() == "dark" else "light"
-            colors = self.soft_colors[mode]
+            colors = self._active_colors
 
             # 上部分 - 字体选择
             top_frame = ctk.CTkFrame(font_dialog)
@@ -4087,12 +5074,15 @@ class NovelManagerGUI:
             self.root.update_idletasks()
 
     def _enhance_listboxes_recursively(self, parent):
-        """递归增强所有Listbox控件的视觉效果"""
-        for widget in parent.winfo_children():
+        """增强子树中所有Listbox控件的视觉效果（迭代遍历，免去递归调用开销）"""
+        pending = deque(parent.winfo_children())
+        while pending:
+            widget = pending.popleft()
             if isinstance(widget, tk.Listbox):
+                # Listbox本身不会再包含子控件，无需继续下钻
                 self._beautify_listbox(widget)
             elif hasattr(widget, 'winfo_children'):
-                self._enhance_listboxes_recursively(widget)
+                pending.extend(widget.winfo_children())
 
     def _beautify_listbox(self, listbox):
         """美化单个Listbox控件的视觉效果"""
@@ -4127,11 +5117,13 @@ class NovelManagerGUI:
 
     def _update_word_count(self, event=None):
         """更新文本编辑器中的字数统计"""
+        if not self._widgets_ready:
+            return
         try:
-            content_widget = getattr(self, 'content_text', None)
-            if content_widget and content_widget.winfo_exists():
+            content_widget = self.content_text
+            if content_widget:
                 # 获取文本内容
-                start_index = "0.0" if isinstance(content_widget, ctk.CTkTextbox) else "1.0"
+                start_index = self._editor_start
                 try:
                     content = content_widget.get(start_index, tk.END)
 
@@ -4170,7 +5162,7 @@ class NovelManagerGUI:
                     self.word_count_var.set(stat_text)
 
                     # 对于tkText，需要重置Modified标志
-                    if isinstance(content_widget, tk.Text):
+                    if not self._editor_is_ctk:
                         content_widget.edit_modified(False)
                 except Exception as e:
                     print(f"字数统计错误: {e}")
@@ -4198,11 +5190,11 @@ class NovelManagerGUI:
         existing_path_str = None
 
         # 如果有选中的条目且文件存在，使用它
-        if self.current_entry_path and Path(self.current_entry_path).exists():
+        if self.current_entry_path and os.path.isfile(self.current_entry_path):
             existing_path_str = self.current_entry_path
             print(f"使用选中条目路径: {existing_path_str}")
         # 如果当前分类中存在同名文件，直接使用该文件路径
-        elif target_path.exists():
+        elif os.path.isfile(target_path):
             existing_path_str = str(target_path)
             print(f"找到当前分类中的同名文件: {existing_path_str}")
         # 在当前entry_data_map中查找同名条目
@@ -4217,8 +5209,10 @@ class NovelManagerGUI:
         old_title = None
         if existing_path_str:
             try:
+                # 目标路径只realpath一次；先做廉价的字符串比较再退回realpath
+                existing_real = os.path.realpath(existing_path_str)
                 for title_text, path in self.entry_data_map.items():
-                    if Path(path).resolve() == Path(existing_path_str).resolve():
+                    if path == existing_path_str or os.path.realpath(path) == existing_real:
                         old_title = title_text
                         print(f"找到旧标题: {old_title} -> {path}")
                         break
@@ -4231,6 +5225,7 @@ class NovelManagerGUI:
                 category, title, content, tags,
                 existing_path_str=existing_path_str
             )
+            self._note_fs_mutation()
 
             # 保存后的路径
             print(f"保存后路径: {saved_path_str}")
@@ -4245,7 +5240,7 @@ class NovelManagerGUI:
                     del self.entry_data_map[old_title]
 
             # 添加/更新新标题映射
-            self.entry_data_map[title] = saved_path_str
+            self.entry_data_map[sys.intern(title)] = sys.intern(saved_path_str)
             print(f"更新映射: {title} -> {saved_path_str}")
 
             # 更新UI状态
@@ -4328,6 +5323,7 @@ class NovelManagerGUI:
                 category, title, content, tags,
                 existing_path_str=None  # 强制作为新条目处理
             )
+            self._note_fs_mutation()
         except (FileExistsError, OSError) as e:
             # 如果仍然冲突（极少情况），使用递增方式继续尝试
             error_str = str(e)
@@ -4342,6 +5338,7 @@ class NovelManagerGUI:
                             category, title, content, tags,
                             existing_path_str=None
                         )
+                        self._note_fs_mutation()
                         break  # 保存成功
                     except (FileExistsError, OSError) as inner_e:
                         if "目标文件名" in str(inner_e) and "已存在" in str(inner_e):
@@ -4367,7 +5364,7 @@ class NovelManagerGUI:
 
             # 直接更新title与路径的映射，确保不需要重新加载即可选择
             if self.current_category == category and not self.is_search_active:
-                self.entry_data_map[title] = saved_path_str
+                self.entry_data_map[sys.intern(title)] = sys.intern(saved_path_str)
 
             # 更新UI状态
             self._update_ui_after_save(saved_path_str, title, category)
@@ -4382,11 +5379,14 @@ class NovelManagerGUI:
     def _get_content_from_editor(self):
         """从编辑器获取内容文本"""
         content = ""
-        content_widget = getattr(self, 'content_text', None)
-        if content_widget and content_widget.winfo_exists():
-            start_index = "0.0" if isinstance(content_widget, ctk.CTkTextbox) else 1.0
+        if not self._widgets_ready or not self._right_pane_built:
+            return content
+        content_widget = self.content_text
+        if content_widget:
+            start_index = self._editor_start
             try:
-                content = content_widget.get(start_index, tk.END).strip()
+                # end-1c排除Text控件自动附加的换行，免去整串strip拷贝
+                content = content_widget.get(start_index, "end-1c")
             except Exception as e:
                 print(f"获取编辑器内容时出错: {e}")
         return content
@@ -4394,18 +5394,21 @@ class NovelManagerGUI:
     def _get_tags_from_entry(self):
         """从标签输入框获取标签列表"""
         tags_text = self.tags_var.get().strip()
-        tags = [t.strip() for t in tags_text.split(",")] if tags_text else []
-        # 过滤空标签
-        return [t for t in tags if t]
+        if not tags_text:
+            return []
+        # 预编译的正则一次完成分割和两侧空白剔除
+        return [t for t in _TAG_SPLIT_RE.split(tags_text) if t]
 
     def _get_current_category_for_save(self):
         """确定当前应该保存到的分类"""
         category = self.current_category
         if self.is_search_active and self.current_entry_path:
             try:
-                path_obj = Path(self.current_entry_path)
-                if path_obj.exists():
-                    category = path_obj.parent.name
+                path_str = self.current_entry_path
+                # 字符串前缀即可确认路径在数据目录下，isfile一次确认存在性
+                root_prefix = self.manager._root_str + os.sep
+                if path_str.startswith(root_prefix) and os.path.isfile(path_str):
+                    category = os.path.basename(os.path.dirname(path_str))
             except Exception as e:
                 print(f"确定保存分类时出错: {e}")
         return category
@@ -4457,6 +5460,9 @@ class NovelManagerGUI:
     # 保留原有on_save方法以兼容其他代码调用
     def on_save(self):
         """根据当前情况决定使用哪个保存方法"""
+        if not self._right_pane_built:
+            print("编辑器尚未构建，无可保存内容")
+            return
         # 检查是否有选择事件来源
         if getattr(self, 'save_source', None) == "update":
             # 使用保存修改
@@ -4473,7 +5479,7 @@ class NovelManagerGUI:
     # 在NovelManagerGUI类的末尾添加AI相关方法
     def on_ai_config(self):
         """打开AI配置对话框"""
-        if not HAS_AI:
+        if not _ai_available():
             messagebox.showwarning("功能不可用", "AI功能模块未找到，请确保ai.py文件存在且可导入。", parent=self.root)
             return
 
@@ -4499,7 +5505,7 @@ class NovelManagerGUI:
 
     def on_ai_optimize(self):
         """打开AI内容优化对话框"""
-        if not HAS_AI:
+        if not _ai_available():
             messagebox.showwarning("功能不可用", "AI功能模块未找到，请确保ai.py文件存在且可导入。", parent=self.root)
             return
 
@@ -4553,6 +5559,7 @@ class NovelManagerGUI:
                             optimized_content,
                             tags
                         )
+                        self._note_fs_mutation()
 
                         # 更新UI
                         self.load_entries(current_category)
@@ -4566,11 +5573,7 @@ class NovelManagerGUI:
                     # 直接更新编辑器内容
                     content_widget = getattr(self, 'content_text', None)
                     if content_widget and content_widget.winfo_exists():
-                        # 清空当前内容
-                        start_index = "0.0" if isinstance(content_widget, ctk.CTkTextbox) else "1.0"
-                        content_widget.delete(start_index, tk.END)
-                        # 插入优化后的内容
-                        content_widget.insert(tk.END, result)
+                        self._set_editor_content(result)
                         # 更新字数统计
                         self._update_word_count()
                         # 提示用户保存
@@ -4598,7 +5601,7 @@ class NovelManagerGUI:
     # 在NovelManagerGUI类的末尾添加AI精简方法
     def on_ai_condenser(self):
         """打开AI小说精简工具窗口"""
-        if not HAS_AI:
+        if not _ai_available():
             messagebox.showwarning("功能不可用", "AI功能模块未找到，请确保ai.py文件存在且可导入。", parent=self.root)
             return
 